@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""Timing scripts for the shared solution utilities.
+
+Run any benchmark module directly, e.g. ``python -m benchmarks.sieve``.
+"""
+import time
+from typing import Any, Callable
+
+
+def bench(label: str, func: Callable[..., Any], *args: Any, repeat: int = 3) -> float:
+    """Print and return the best wall time of ``repeat`` calls to ``func``."""
+    best = float("inf")
+    for _ in range(repeat):
+        t_0 = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t_0)
+    print(f"[{best:.5f} sec]\t{label}")
+    return best
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Compare the strided divisor sum sieve with the original element-wise loop."""
+import numpy as np
+
+from euler import problem_21, problem_23
+
+from . import bench
+
+
+def legacy_divisor_sums(n: int) -> np.ndarray:
+    """Original implementation of ``problem_21.divisor_sums``."""
+    sums = np.zeros(n, dtype=int)
+    for i in range(1, n):
+        j = 2 * i
+        while j < n:
+            sums[j] += i
+            j += i
+    return sums
+
+
+def main() -> None:
+    for n in (10_000, 28_123):
+        bench(f"legacy   divisor_sums({n})", legacy_divisor_sums, n, repeat=1)
+        bench(f"strided  divisor_sums({n})", problem_21.divisor_sums, n)
+    for n in (10**6, 10**7):
+        bench(f"strided  divisor_sums({n})", problem_21.divisor_sums, n)
+    bench("problem_21.solve()", problem_21.solve.__wrapped__)  # type: ignore
+    bench("problem_23.solve()", problem_23.solve.__wrapped__)  # type: ignore
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Compare cold and incremental prime mask extension."""
+import numpy as np
+
+from euler.utils import _sieve
+
+from . import bench
+
+EMPTY = np.zeros(2, dtype=np.bool_)
+
+
+def main() -> None:
+    for exponent in (6, 7, 8):
+        n = 10**exponent
+        repeat = 3 if exponent < 8 else 1
+        bench(f"cold         0 -> 10^{exponent}", _sieve, EMPTY, n, repeat=repeat)
+        cached = _sieve(EMPTY, n // 2)
+        bench(
+            f"incremental  10^{exponent}/2 -> 10^{exponent}",
+            _sieve,
+            cached,
+            n,
+            repeat=repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
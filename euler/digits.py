@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Digit operations on integer arrays.
+
+Every kernel works on whole NumPy arrays with integer arithmetic (powers of
+ten) instead of formatting to strings. Inputs must be non-negative; int64 arrays
+are fastest, and object arrays of Python ints work for larger values.
+"""
+import itertools
+from typing import Iterable, Iterator, Literal, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+IntArray = npt.NDArray[np.int64]
+
+
+def _pow10(exponent: IntArray, like: np.ndarray) -> np.ndarray:
+    """Raise 10 to each exponent in the dtype of ``like``."""
+    return 10 ** exponent.astype(like.dtype)
+
+
+def digit_count(values: npt.ArrayLike) -> IntArray:
+    """Count the decimal digits of each value (zero has one digit)."""
+    rest = np.asarray(values) // 10
+    count = np.ones(rest.shape, dtype=np.int64)
+    while (more := rest > 0).any():
+        count += more
+        rest //= 10
+    return count
+
+
+def digit_sum(values: npt.ArrayLike) -> IntArray:
+    """Sum the decimal digits of each value."""
+    rest = np.array(values)
+    total = np.zeros_like(rest)
+    while (rest > 0).any():
+        total += rest % 10
+        rest //= 10
+    return total
+
+
+def reverse_digits(values: npt.ArrayLike) -> IntArray:
+    """Reverse the decimal digits of each value (trailing zeros are dropped)."""
+    rest = np.array(values)
+    result = np.zeros_like(rest)
+    while (active := rest > 0).any():
+        result[active] = result[active] * 10 + rest[active] % 10
+        rest //= 10
+    return result
+
+
+def digit_signature(values: npt.ArrayLike) -> IntArray:
+    """
+    Pack how often each decimal digit occurs in each value into an integer,
+    using four bits per digit, so that two values are permutations of each
+    other exactly when their signatures match. Digits may occur at most 15 times.
+    """
+    rest = np.array(values, dtype=np.int64)
+    signature = np.zeros(rest.shape, dtype=np.int64)
+    active = np.ones(rest.shape, dtype=bool)  # zero has one digit
+    while active.any():
+        signature[active] += np.left_shift(1, 4 * (rest[active] % 10))
+        rest //= 10
+        active = rest > 0
+    return signature
+
+
+def concat(left: npt.ArrayLike, right: npt.ArrayLike) -> IntArray:
+    """Concatenate the decimal digits of the (broadcast) inputs."""
+    right = np.asarray(right)
+    result: IntArray = np.asarray(left) * _pow10(digit_count(right), right) + right
+    return result
+
+
+def rotations(values: npt.ArrayLike) -> IntArray:
+    """
+    Get every left rotation of the digits of each value, as an array of shape
+    ``(max digits, len(values))``. Row ``r`` holds each value rotated by ``r``
+    places (modulo its own digit count), so row 0 is the input.
+    """
+    values = np.asarray(values)
+    count = digit_count(values)
+    rows = []
+    for r in range(int(count.max(initial=1))):
+        shift = r % count
+        head = _pow10(count - shift, values)
+        rows.append(values % head * _pow10(shift, values) + values // head)
+    return np.stack(rows)
+
+
+def truncations(
+    values: npt.ArrayLike, side: Literal["left", "right"] = "left"
+) -> IntArray:
+    """
+    Get every truncation of the digits of each value, as an array of shape
+    ``(max digits, len(values))``. Row ``i`` holds each value with ``i`` digits
+    removed from the given side, keeping at least one digit, so row 0 is the
+    input.
+    """
+    values = np.asarray(values)
+    count = digit_count(values)
+    rows = []
+    for i in range(int(count.max(initial=1))):
+        removed = np.minimum(i, count - 1)
+        if side == "left":
+            rows.append(values % _pow10(count - removed, values))
+        else:
+            rows.append(values // _pow10(removed, values))
+    return np.stack(rows)
+
+
+def digit_multisets(
+    length: int, digits: Iterable[int] = range(10)
+) -> Iterator[tuple[int, ...]]:
+    """Generate every multiset of ``length`` digits as a sorted tuple."""
+    return itertools.combinations_with_replacement(sorted(set(digits)), length)
+
+
+def weighted_length_bound(weights: Sequence[int]) -> int:
+    """
+    Get the most digits a number can have and still equal the sum of the
+    weights of its digits.
+
+    An N-digit number is at least 10^(N - 1) while its weight sum is at most
+    N * max(weights), so once the former is larger no longer number can work.
+    """
+    top = max(weights)
+    length = 1
+    while 10**length <= top * (length + 1):
+        length += 1
+    return length
+
+
+def digit_weight_sums(
+    weights: Sequence[int], max_length: int | None = None
+) -> Iterator[int]:
+    """
+    Generate (in ascending order) the numbers that equal the sum of
+    ``weights[d]`` over their digits d, e.g. factorials or fixed powers.
+
+    The sum only depends on which digits occur, so it is computed once per digit
+    multiset and kept if its own digits are that multiset.
+    """
+    if max_length is None:
+        max_length = weighted_length_bound(weights)
+    for length in range(1, max_length + 1):
+        found = []
+        for multiset in digit_multisets(length, range(len(weights))):
+            total = sum(weights[d] for d in multiset)
+            digits: list[int] = []
+            rest = total
+            while rest and len(digits) <= length:
+                rest, d = divmod(rest, 10)
+                digits.append(d)
+            if tuple(sorted(digits)) == multiset:
+                found.append(total)
+        yield from sorted(found)
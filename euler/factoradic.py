@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Factorial number system: ranking and unranking lexicographic permutations.
+
+https://en.wikipedia.org/wiki/Factorial_number_system
+"""
+import itertools
+import operator
+from typing import Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Precomputed up to 20! (the largest factorial that fits in an int64)
+_FACTORIALS = list(itertools.accumulate(range(1, 21), operator.mul, initial=1))
+
+
+def factorial(n: int) -> int:
+    """Compute the factorial of natural number n using the lookup table."""
+    if n < 0:
+        raise ValueError(f"Factorial is undefined for negative numbers ({n=})")
+    while len(_FACTORIALS) <= n:
+        _FACTORIALS.append(_FACTORIALS[-1] * len(_FACTORIALS))
+    return _FACTORIALS[n]
+
+
+class _FenwickTree:
+    """Binary indexed tree over 0/1 flags marking the elements still unused."""
+
+    __slots__ = ("tree", "size")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        # Every flag starts at 1, so each node holds the length of its range
+        self.tree = [0] + [i & -i for i in range(1, size + 1)]
+
+    def remove(self, index: int) -> None:
+        """Clear the flag at the (0-based) index."""
+        i = index + 1
+        while i <= self.size:
+            self.tree[i] -= 1
+            i += i & -i
+
+    def count_below(self, index: int) -> int:
+        """Count the set flags at indices below the (0-based) index."""
+        total = 0
+        i = index
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def find(self, k: int) -> int:
+        """Find the (0-based) index of the k-th (0-based) set flag."""
+        i = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            if i + step <= self.size and self.tree[i + step] <= k:
+                i += step
+                k -= self.tree[i]
+            step >>= 1
+        return i
+
+
+def nth_permutation(seq: Iterable[T], k: int) -> list[T]:
+    """
+    Get the k-th (0-based) lexicographic permutation of the distinct items in
+    the input sequence, in O(n log n).
+    """
+    items = sorted(seq)  # type: ignore[type-var]
+    if not 0 <= k < factorial(len(items)):
+        raise ValueError(f"No permutation {k} of {len(items)} items")
+    unused = _FenwickTree(len(items))
+    result = []
+    for i in reversed(range(len(items))):
+        # The next factoradic digit selects among the remaining items
+        digit, k = divmod(k, factorial(i))
+        index = unused.find(digit)
+        unused.remove(index)
+        result.append(items[index])
+    return result
+
+
+def permutation_rank(perm: Sequence[T]) -> int:
+    """
+    Get the (0-based) lexicographic rank of a permutation of distinct items, in
+    O(n log n).
+    """
+    order = {item: i for i, item in enumerate(sorted(perm))}  # type: ignore
+    unused = _FenwickTree(len(perm))
+    rank = 0
+    for i, item in enumerate(perm):
+        index = order[item]
+        rank += unused.count_below(index) * factorial(len(perm) - 1 - i)
+        unused.remove(index)
+    return rank
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Fibonacci numbers, indexed so that F(0) = 0 and F(1) = 1."""
+from typing import Iterator
+
+
+def _fibonacci_pair(n: int) -> tuple[int, int]:
+    """Compute ``(F(n), F(n + 1))`` by fast doubling."""
+    a, b = 0, 1
+    for bit in f"{n:b}":
+        # F(2k) = F(k) * (2F(k + 1) - F(k)) and F(2k + 1) = F(k)^2 + F(k + 1)^2
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a, b
+
+
+def fibonacci(n: int) -> int:
+    """Compute the N-th fibonacci number in O(log n) multiplications."""
+    if n < 0:
+        raise ValueError(f"Fibonacci index must be non-negative ({n=})")
+    return _fibonacci_pair(n)[0]
+
+
+def iter_fibonacci(start: int = 0) -> Iterator[int]:
+    """Generate fibonacci numbers starting from the N-th fibonacci number."""
+    if start < 0:
+        raise ValueError(f"Fibonacci index must be non-negative ({start=})")
+    a, b = _fibonacci_pair(start)
+    while True:
+        yield a
+        a, b = b, a + b
+
+
+def even_fibonacci_sum(limit: int) -> int:
+    """
+    Sum the even fibonacci numbers that do not exceed the limit.
+
+    Every third fibonacci number is even, and the even terms satisfy their own
+    recurrence: E(k) = 4E(k - 1) + E(k - 2), with E(0) = 0 and E(1) = 2.
+    """
+    total = 0
+    a, b = 0, 2
+    while b <= limit:
+        total += b
+        a, b = b, 4 * b + a
+    return total
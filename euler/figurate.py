@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""Polygonal (figurate) numbers.
+
+The n-th s-gonal number is P(s, n) = ((s - 2)n² - (s - 4)n) / 2, so s = 3 gives
+the triangular numbers, s = 5 the pentagonal numbers and s = 6 the hexagonal
+numbers. Membership tests solve that quadratic for n with exact integer square
+roots, so they hold for arbitrarily large values.
+"""
+import itertools
+import math
+from typing import Iterable, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+# Vectorised tests keep the discriminant below this bound so that the integer
+# square root correction cannot overflow int64; larger values are checked one
+# at a time
+_DISCRIMINANT_MAX = 1 << 62
+
+
+def _check_sides(s: int) -> None:
+    if s < 3:
+        raise ValueError(f"Polygons have at least three sides ({s=})")
+
+
+def polygonal(s: int, n: int) -> int:
+    """Compute the N-th S-gonal number."""
+    _check_sides(s)
+    return ((s - 2) * n * n - (s - 4) * n) // 2
+
+
+def polygonal_numbers(s: int, start: int = 1) -> Iterator[int]:
+    """Generate S-gonal numbers starting from the START-th one."""
+    _check_sides(s)
+    for n in itertools.count(start):
+        yield ((s - 2) * n * n - (s - 4) * n) // 2
+
+
+def is_polygonal(x: int, s: int) -> bool:
+    """
+    Return True if X is a (positive) S-gonal number, i.e. if
+    n = ((s - 4) + sqrt(8(s - 2)x + (s - 4)²)) / (2(s - 2)) is an integer.
+    """
+    _check_sides(s)
+    if x < 1:
+        return False
+    discriminant = 8 * (s - 2) * x + (s - 4) ** 2
+    root = math.isqrt(discriminant)
+    return root * root == discriminant and (root + s - 4) % (2 * (s - 2)) == 0
+
+
+def is_triangular(x: int) -> bool:
+    """Return True if X is a triangular number."""
+    return is_polygonal(x, 3)
+
+
+def is_pentagonal(x: int) -> bool:
+    """Return True if X is a pentagonal number."""
+    return is_polygonal(x, 5)
+
+
+def is_hexagonal(x: int) -> bool:
+    """Return True if X is a hexagonal number."""
+    return is_polygonal(x, 6)
+
+
+def polygonal_mask(values: npt.ArrayLike, s: int) -> npt.NDArray[np.bool_]:
+    """Test every value for being S-gonal (see ``is_polygonal``)."""
+    _check_sides(s)
+    values = np.asarray(values)
+    mask = np.zeros(values.shape, dtype=bool)
+    if values.dtype.kind not in "iu":
+        # Python ints that may not fit in 64 bits
+        flat = values.ravel()
+        mask.ravel()[:] = [is_polygonal(int(x), s) for x in flat]
+        return mask
+    limit = (_DISCRIMINANT_MAX - (s - 4) ** 2) // (8 * (s - 2))
+    small = (values >= 1) & (values <= limit)
+    x = values[small].astype(np.int64)
+    discriminant = 8 * (s - 2) * x + (s - 4) ** 2
+    # The float root is at most one off, so nudge it onto the integer root
+    root = np.sqrt(discriminant.astype(np.float64)).astype(np.int64)
+    root -= root * root > discriminant
+    root += (root + 1) * (root + 1) <= discriminant
+    mask[small] = (root * root == discriminant) & ((root + s - 4) % (2 * (s - 2)) == 0)
+    for i in zip(*np.nonzero(values > limit)):
+        mask[i] = is_polygonal(int(values[i]), s)
+    return mask
+
+
+def common_polygonals(sides: Iterable[int], start: int = 1) -> Iterator[int]:
+    """
+    Generate (in ascending order) the numbers that are polygonal for every one
+    of the given numbers of sides.
+
+    Only the sparsest sequence (the most sides) is generated, starting from its
+    START-th number, and the others are tested against it. For example every
+    hexagonal number is triangular, so hexagonal numbers drive the search for
+    triangular, pentagonal and hexagonal numbers.
+    """
+    order = sorted(set(sides), reverse=True)
+    if not order:
+        raise ValueError("At least one polygon is required")
+    for x in polygonal_numbers(order[0], start):
+        if all(is_polygonal(x, s) for s in order[1:]):
+            yield x
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Palindromic number generation in any base.
+
+Palindromes are built directly by mirroring their leading half, so generating
+every palindrome below N only touches about sqrt(N) candidates.
+"""
+from typing import Iterable, Iterator
+
+
+def reverse(n: int, base: int = 10) -> int:
+    """Reverse the digits of N in the given base."""
+    result = 0
+    while n:
+        n, d = divmod(n, base)
+        result = result * base + d
+    return result
+
+
+def is_palindrome(n: int, base: int = 10) -> bool:
+    """Return True if N reads the same both ways in the given base."""
+    return n == reverse(n, base)
+
+
+def palindromes_of_length(
+    length: int, base: int = 10, descending: bool = False
+) -> Iterator[int]:
+    """Generate every palindrome with exactly ``length`` digits, in order."""
+    if length < 1:
+        return
+    if length == 1:
+        yield from range(base - 1, -1, -1) if descending else range(base)
+        return
+    half, odd = divmod(length, 2)
+    lo, hi = base ** (half + odd - 1), base ** (half + odd)
+    shift = base**half
+    # Increasing prefixes give increasing palindromes of a fixed length
+    for prefix in range(hi - 1, lo - 1, -1) if descending else range(lo, hi):
+        yield prefix * shift + reverse(prefix // base if odd else prefix, base)
+
+
+def palindromes(stop: int, base: int = 10, descending: bool = False) -> Iterator[int]:
+    """Generate every palindrome below STOP in the given base, in order."""
+    if stop <= 0:
+        return
+    # Number of digits of the largest candidate
+    length, rest = 1, stop - 1
+    while rest >= base:
+        rest //= base
+        length += 1
+    lengths = range(length, 0, -1) if descending else range(1, length + 1)
+    for size in lengths:
+        for n in palindromes_of_length(size, base, descending):
+            if n < stop:
+                yield n
+            elif not descending:
+                return
+
+
+def multibase_palindromes(stop: int, bases: Iterable[int] = (10, 2)) -> Iterator[int]:
+    """
+    Generate (in ascending order) the numbers below STOP that are palindromes in
+    every one of the bases.
+    """
+    # The largest base has the fewest palindromes, so it drives the search
+    order = sorted(set(bases), reverse=True)
+    if not order:
+        raise ValueError("At least one base is required")
+    for n in palindromes(stop, order[0]):
+        if all(is_palindrome(n, base) for base in order[1:]):
+            yield n
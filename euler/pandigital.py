@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Pandigital number generation.
+
+An n-digit number is pandigital if it makes use of all the digits 1 to n (or
+more generally, every digit of a given set) exactly once.
+"""
+import functools
+import itertools
+from typing import Callable, Iterable, Iterator, Optional
+
+# Called with (prefix, prefix length); returning False skips every number that
+# starts with that prefix
+Prune = Callable[[int, int], bool]
+_TAIL = 3
+
+
+def is_pandigital(n: int, digits: Iterable[int] = range(1, 10)) -> bool:
+    """Return True if N uses every one of the digits exactly once."""
+    expected = 0
+    for d in digits:
+        expected |= 1 << d
+    seen = 0
+    while True:
+        bit = 1 << (n % 10)
+        if seen & bit:
+            return False
+        seen |= bit
+        n //= 10
+        if not n:
+            return seen == expected
+
+
+@functools.lru_cache(maxsize=1024)
+def _suffixes(digits: tuple[int, ...], length: int) -> list[int]:
+    """Get the values of every ordered selection of ``length`` of the digits."""
+    values = []
+    for perm in itertools.permutations(digits, length):
+        value = 0
+        for d in perm:
+            value = value * 10 + d
+        values.append(value)
+    return values
+
+
+def pandigitals(
+    digits: Iterable[int] = range(1, 10),
+    length: Optional[int] = None,
+    descending: bool = False,
+    prune: Optional[Prune] = None,
+) -> Iterator[int]:
+    """
+    Generate numbers built from ``length`` distinct digits of the input (all of
+    them by default) in ascending or descending order. Numbers never start with
+    a 0, unless they are the single digit 0.
+
+    Numbers are built one digit at a time, so the optional ``prune`` callback
+    can reject a prefix (and every number that starts with it) at any depth.
+    """
+    order = sorted(set(digits), reverse=descending)
+    size = len(order) if length is None else length
+    if not 0 < size <= len(order):
+        return
+    # Without a prune callback the last few digits come from cached tables
+    tail = 0 if prune is not None else min(size, _TAIL)
+    if tail == size:
+        smallest = 10 ** (size - 1) if size > 1 else 0
+        yield from (v for v in _suffixes(tuple(order), size) if v >= smallest)
+        return
+    # Depth-first over digit positions, keeping a stack of the unused digits
+    # and an iterator over the ones still to try at each position
+    unused = [order]
+    choices = [iter(order)]
+    prefixes = [0]
+    while choices:
+        for d in choices[-1]:
+            if d == 0 and len(prefixes) == 1 and size > 1:
+                continue  # leading zero
+            value = prefixes[-1] * 10 + d
+            if prune is not None and not prune(value, len(prefixes)):
+                continue
+            if len(prefixes) == size:
+                yield value
+                continue
+            rest = [r for r in unused[-1] if r != d]
+            if len(prefixes) + tail == size:
+                base = value * 10**tail
+                for suffix in _suffixes(tuple(rest), tail):
+                    yield base + suffix
+                continue
+            unused.append(rest)
+            choices.append(iter(rest))
+            prefixes.append(value)
+            break
+        else:
+            unused.pop()
+            choices.pop()
+            prefixes.pop()
@@ -12,30 +12,13 @@ terms. By starting with 1 and 2, the first 10 terms will be:
 By considering the terms in the Fibonacci sequence whose values do not exceed
 four million, find the sum of the even-valued terms.
 """
-import functools
-
+from .fibonacci import even_fibonacci_sum
 from .utils import print_result
 
 
-@functools.lru_cache(1000000, typed=True)
-def fibonacci(n: int) -> int:
-    """Compute the N-th fibonacci number."""
-    if n in (0, 1):
-        return 1
-    return fibonacci(n - 1) + fibonacci(n - 2)
-
-
 @print_result
 def solve() -> int:
-    total = 0
-    n = 2
-    while True:
-        value = fibonacci(n)
-        if value > 4000000:
-            break
-        total += value
-        n += 3
-    return total
+    return even_fibonacci_sum(4_000_000)
 
 
 if __name__ == "__main__":
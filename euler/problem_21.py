@@ -14,19 +14,22 @@ and 110; therefore d(220) = 284. The proper divisors of 284 are 1, 2, 4, 71 and
 
 Evaluate the sum of all the amicable numbers under 10000.
 """
+import math
+
 import numpy as np
+import numpy.typing as npt
 
 from .utils import print_result
 
 
-def divisor_sums(n: int) -> np.ndarray:
+def divisor_sums(n: int, dtype: npt.DTypeLike = np.int64) -> np.ndarray:
     """Generate a flat array of sums of proper divisors of numbers less than n."""
-    sums = np.zeros(n, dtype=int)
-    for i in range(1, n):
-        j = 2 * i
-        while j < n:
-            sums[j] += i
-            j += i
+    sums = np.zeros(n, dtype=dtype)
+    sums[2:] = 1
+    # Each divisor pair (i, j // i) of j with 2 <= i <= sqrt(j) is added at once
+    for i in range(2, math.isqrt(max(n - 1, 0)) + 1):
+        sums[i * i :: i] += np.arange(i, (n - 1) // i + 1, dtype=dtype) + i
+        sums[i * i] -= i  # square roots only count once
     return sums
 
 
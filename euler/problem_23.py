@@ -22,36 +22,42 @@ than this limit.
 Find the sum of all the positive integers which cannot be written as the sum of
 two abundant numbers.
 """
+from typing import cast
+
+import numpy as np
+
 from .problem_21 import divisor_sums
 from .utils import print_result
 
 
+def abundant_mask(n: int) -> np.ndarray:
+    """Generate boolean array of length n, where abundant indices are True."""
+    return divisor_sums(n) > np.arange(n)
+
+
 def abundant_numbers(n: int) -> list[int]:
     """Get all abundant numbers below n."""
-    abundant = []
-    for a, b in enumerate(divisor_sums(n)):
-        if b > a:
-            abundant.append(a)
-    return abundant
-
-
-def abundant_sums(n: int) -> set[int]:
-    """Get all integers below n that can be written as the sum of two abundant numbers."""
-    abundant = abundant_numbers(n)
-    sums = set()
-    for i, a in enumerate(abundant):
-        for b in abundant[i:]:
-            s = a + b
-            if s > n:
-                break
-            sums.add(s)
-    return sums
+    return cast(list[int], np.flatnonzero(abundant_mask(n)).tolist())
+
+
+def abundant_sums(n: int) -> np.ndarray:
+    """
+    Generate boolean array of length n, where indices that can be written as
+    the sum of two abundant numbers are True.
+
+    The number of ways to write each index as a sum is the self-convolution of
+    the abundant mask, which is computed with a real FFT.
+    """
+    size = 1 << (2 * n).bit_length()
+    spectrum = np.fft.rfft(abundant_mask(n).astype(np.float64), size)
+    ways = np.fft.irfft(spectrum * spectrum, size)[:n]
+    return ways > 0.5
 
 
 @print_result
 def solve() -> int:
     n = 28123
-    return sum(set(range(n)) - abundant_sums(n))
+    return int(np.flatnonzero(~abundant_sums(n)).sum())
 
 
 if __name__ == "__main__":
@@ -14,32 +14,13 @@ lexicographic permutations of 0, 1 and 2 are:
 What is the millionth lexicographic permutation of the digits
 0, 1, 2, 3, 4, 5, 6, 7, 8 and 9?
 """
-import functools
-
+from .factoradic import nth_permutation
 from .utils import print_result
 
 
-@functools.lru_cache(10, typed=True)
-def factorial(n: int) -> int:
-    """Compute the factorial of natural number n."""
-    if n in (1, 0):
-        return 1
-    return n * factorial(n - 1)
-
-
 @print_result
 def solve() -> int:
-    target = 1000000
-    total = 0
-    digits = list(range(10))
-    result = []
-    for n in digits[::-1]:
-        m = 1
-        while total + factorial(n) < target:
-            m += 1
-            total += factorial(n)
-        result.append(f"{digits.pop(m - 1)}")
-    return int("".join(result))
+    return int("".join(f"{d}" for d in nth_permutation(range(10), 999_999)))
 
 
 if __name__ == "__main__":
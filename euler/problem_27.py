@@ -28,46 +28,86 @@ Find the product of the coefficients, a and b, for the quadratic expression
 that produces the maximum number of primes for consecutive values of n,
 starting with n = 0.
 """
-import functools
-
 import numpy as np
+import numpy.typing as npt
 
-from .utils import prime_mask, print_result
-
-
-def func(n: int, a: int, b: int) -> int:
-    return n**2 + a * n + b
+from .utils import prime_list, prime_mask, print_result
 
+A_MAX = 999
+B_MAX = 1000
+BLOCK_SIZE = 1 << 18
 
-@functools.lru_cache
-def primes() -> np.ndarray:
-    return prime_mask(func(1000, 1000, 1000))
 
+def prime_runs(a: npt.ArrayLike, b: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """
+    Count, for each (broadcast) pair of coefficients, the consecutive n >= 0 for
+    which n^2 + an + b is prime.
 
-@functools.lru_cache()
-def depth(a: int, b: int) -> int:
-    """Return the number of consecutive N that produce a prime for func(n, a, b)."""
+    All pairs advance together one n at a time, and pairs are dropped from the
+    computation as soon as they produce a non-prime (values below 2 included).
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.int64), b)
+    shape = a.shape
+    a, b = a.ravel(), b.ravel().astype(np.int64)
+    runs = np.zeros(a.shape, dtype=np.int64)
+    alive = np.arange(len(a))
     n = 0
-    while primes()[func(n, a, b)]:
+    while len(alive):
+        values = n * n + a[alive] * n + b[alive]
+        primes = prime_mask(max(int(values.max()), 2) + 1)
+        prime = values >= 2
+        prime[prime] = primes[values[prime]]
+        alive = alive[prime]
+        runs[alive] += 1
         n += 1
-    return n
+    return runs.reshape(shape)
+
+
+def _candidate_pairs(
+    b: npt.NDArray[np.int64], a_max: int, primes: npt.NDArray[np.int64]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    Get the pairs that survive n = 0 and n = 1, i.e. every prime b with each
+    |a| <= A_MAX that makes 1 + a + b prime, ordered by b and then a.
+    """
+    lo = np.searchsorted(primes, 1 + b - a_max)
+    hi = np.searchsorted(primes, 1 + b + a_max, side="right")
+    counts = hi - lo
+    # Index of every selected prime, row by row
+    offsets = np.repeat(lo - np.cumsum(counts) + counts, counts)
+    selected = primes[offsets + np.arange(counts.sum())]
+    b_pairs = np.repeat(b, counts)
+    return selected - 1 - b_pairs, b_pairs
+
+
+def best_quadratic(
+    a_max: int = A_MAX, b_max: int = B_MAX, block_size: int = BLOCK_SIZE
+) -> tuple[int, int, int]:
+    """
+    Find the coefficients |a| <= A_MAX and |b| <= B_MAX of the quadratic that
+    produces the most consecutive primes, returned with that count as
+    ``(a, b, run)``. Ties go to the smallest b, then the smallest a.
+    """
+    primes = np.array(prime_list(b_max + a_max + 2), dtype=np.int64)
+    # B must be prime to satisfy f(n=0)
+    b = primes[primes <= b_max]
+    best = (0, 0, 0)
+    rows = max(block_size // (2 * a_max + 1), 1)
+    for start in range(0, len(b), rows):
+        a_pairs, b_pairs = _candidate_pairs(b[start : start + rows], a_max, primes)
+        if not len(a_pairs):
+            continue
+        runs = prime_runs(a_pairs, b_pairs)
+        i = int(np.argmax(runs))
+        if runs[i] > best[2]:
+            best = (int(a_pairs[i]), int(b_pairs[i]), int(runs[i]))
+    return best
 
 
 @print_result
 def solve() -> int:
-    d_max = 0
-    best = None
-    for b in range(-999, 1001, 2):
-        # B must be prime to satisfy f(n=0)
-        if not primes()[b]:
-            continue
-        for a in range(-999, 1000):
-            if depth(a, b) > d_max:
-                best = (a, b)
-                d_max = depth(a, b)
-    if best is None:
-        raise RuntimeError("Failed to find solution")
-    return best[0] * best[1]
+    a, b, _ = best_quadratic(A_MAX, B_MAX)
+    return a * b
 
 
 if __name__ == "__main__":
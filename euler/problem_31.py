@@ -15,21 +15,66 @@ It is possible to make £2 in the following way:
 
 How many different ways can £2 be made using any number of coins?
 """
+from typing import Sequence
+
+import numpy as np
+
 from .utils import print_result
 
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def _running_sum(grid: np.ndarray, modulus: int | None, exact: bool) -> np.ndarray:
+    """Cumulative sum down the columns, reduced by the modulus if provided."""
+    if modulus is None or exact:
+        grid = np.cumsum(grid, axis=0)
+        return grid if modulus is None else grid % modulus
+    # Sum in blocks of rows small enough that the partial sums cannot overflow
+    block = _INT64_MAX // modulus - 1
+    carry = np.zeros(grid.shape[1], dtype=grid.dtype)
+    for start in range(0, len(grid), block):
+        part = grid[start : start + block]
+        np.cumsum(part, axis=0, out=part)
+        part += carry
+        part %= modulus
+        carry = part[-1].copy()
+    return grid
+
+
+def change_ways(
+    target: int,
+    values: Sequence[int],
+    modulus: int | None = None,
+    exact: bool = False,
+) -> np.ndarray:
+    """
+    Count the ways to make every amount from 0 to ``target`` using any number
+    of coins with the given values, in O(target * len(values)).
+
+    Counts are int64 by default and overflow silently once they pass 2^63. Use
+    ``exact`` for arbitrary precision (Python int) counts, or ``modulus`` to get
+    the counts reduced modulo a number.
+    """
+    # Large moduli leave no headroom for int64 sums
+    exact = exact or modulus is not None and modulus > 1 << 61
+    ways = np.zeros(target + 1, dtype=object if exact else np.int64)
+    ways[0] = 1 if modulus is None else 1 % modulus
+    for v in values:
+        if v <= 0:
+            raise ValueError(f"Coin values must be positive ({v=})")
+        # ways[t] += ways[t - v] in increasing t is a running sum over each
+        # residue class mod v, i.e. down the columns of a (rows, v) grid
+        rows = -(-(target + 1) // v)
+        grid = np.zeros(rows * v, dtype=ways.dtype)
+        grid[: target + 1] = ways
+        grid = _running_sum(grid.reshape(rows, v), modulus, exact)
+        ways = grid.ravel()[: target + 1]
+    return ways
+
 
 def make_change(target: int, values: list[int]) -> int:
-    count = 0
-    while values:
-        v = values.pop()
-        i = 1
-        while i * v < target:
-            count += make_change(target - i * v, values[:])
-            i += 1
-        else:
-            if i * v == target:
-                count += 1
-    return count
+    """Count the ways to make the target amount out of the coin values."""
+    return int(change_ways(target, values)[target])
 
 
 @print_result
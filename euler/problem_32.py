@@ -17,23 +17,28 @@ be written as a 1 through 9 pandigital.
 HINT: Some products can be obtained in more than one way so be sure to only
 include it once in your sum.
 """
-import itertools
-
+from .pandigital import is_pandigital, pandigitals
 from .utils import print_result
 
 
 @print_result
 def solve() -> int:
     products = set()
-    l_p = 4  # only works for products of length 4
-    for perm in itertools.permutations("123456789"):
-        p = int("".join(perm[:l_p]))
-        for l_a, l_b in ((3, 2), (4, 1)):
-            a = int("".join(perm[l_p : l_p + l_a]))
-            b = int("".join(perm[l_p + l_a :]))
-            if p == a * b:
+    # The product has 4 digits, so the other 5 digits split as 1 x 4 or 2 x 3
+    for l_b in (4, 3):
+        scale = 10**l_b
+
+        def product_bound(prefix: int, size: int) -> bool:
+            # Smallest multiplicand and multiplier starting with this prefix
+            smallest: int = prefix * 10 ** (5 - size)
+            a, b = divmod(smallest, scale)
+            return a * max(b, scale // 10) < 10_000
+
+        for ab in pandigitals(length=5, prune=product_bound):
+            a, b = divmod(ab, scale)
+            p = a * b
+            if p >= 1000 and is_pandigital(ab * 10_000 + p):
                 products.add(p)
-                break
     return sum(products)
 
 
@@ -12,34 +12,20 @@ There are thirteen such primes below 100: 2, 3, 5, 7, 11, 13, 17, 31, 37, 71,
 
 How many circular primes are there below one million?
 """
-from typing import Iterator
+import numpy as np
 
+from .digits import rotations
 from .utils import prime_mask, print_result
 
 MAX = 1_000_000
 
 
-def rotations(word: str) -> Iterator[str]:
-    """Generate all rotations of the input word."""
-    for i in range(1, len(word)):
-        yield word[i:] + word[:i]
-
-
 @print_result
 def solve() -> int:
     primes = prime_mask(MAX)
-    count = 1  # include 2
-    for n in range(3, MAX, 2):
-        # Check number
-        if not primes[n]:
-            continue
-        # Check rotations
-        for rot in rotations(f"{n}"):
-            if not primes[int(rot)]:
-                break
-        else:
-            count += 1
-    return count
+    candidates = np.flatnonzero(primes[:MAX])
+    # Rotations never add digits, so they all stay inside the mask
+    return int(primes[rotations(candidates)].all(axis=0).sum())
 
 
 if __name__ == "__main__":
@@ -12,15 +12,13 @@ base 10 and base 2.
 (Please note that the palindromic number, in either base, may not include
 leading zeros.)
 """
-from .problem_4 import is_palindrome
+from .palindromes import multibase_palindromes
 from .utils import print_result
 
 
 @print_result
 def solve() -> int:
-    return sum(
-        n for n in range(1000000) if is_palindrome(f"{n}") and is_palindrome(bin(n)[2:])
-    )
+    return sum(multibase_palindromes(1_000_000, (10, 2)))
 
 
 if __name__ == "__main__":
@@ -14,37 +14,24 @@ right and right to left.
 
 NOTE: 2, 3, 5, and 7 are not considered to be truncatable primes.
 """
-from typing import Iterator
+import numpy as np
 
+from .digits import truncations
 from .utils import prime_mask, print_result
 
 MAX = 750_000
 
 
-def truncations(word: str) -> Iterator[str]:
-    """Generate all truncations of the input word."""
-    for i in range(1, len(word)):
-        yield word[i:]  # left truncation
-        yield word[:-i]  # right truncation
-
-
 @print_result
 def solve() -> int:
-    results: list[int] = []
     primes = prime_mask(MAX)
-    for n in range(11, MAX, 2):
-        # Check number
-        if not primes[n]:
-            continue
-        # Check truncations
-        for trunc in truncations(f"{n}"):
-            if not primes[int(trunc)]:
-                break
-        else:
-            results.append(n)
-            if len(results) == 11:
-                return sum(results)
-    raise RuntimeError("Failed to find solution")
+    candidates = np.flatnonzero(primes[11:MAX]) + 11
+    left = primes[truncations(candidates, "left")].all(axis=0)
+    right = primes[truncations(candidates, "right")].all(axis=0)
+    results = candidates[left & right]
+    if len(results) < 11:
+        raise RuntimeError("Failed to find solution")
+    return int(results[:11].sum())
 
 
 if __name__ == "__main__":
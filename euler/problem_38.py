@@ -20,8 +20,7 @@ The same can be achieved by starting with 9 and multiplying by 1, 2, 3, 4, and
 What is the largest 1 to 9 pandigital 9-digit number that can be formed as the
 concatenated product of an integer with (1,2, ... , n) where n > 1?
 """
-import itertools
-
+from .pandigital import pandigitals
 from .utils import print_result
 
 
@@ -46,10 +45,9 @@ def concatenated_product(n_str: str) -> bool:
 
 @print_result
 def solve() -> int:
-    for perm in itertools.permutations("987654321"):
-        pandigital = "".join(perm)
-        if concatenated_product(pandigital):
-            return int(pandigital)
+    for pandigital in pandigitals(descending=True):
+        if concatenated_product(f"{pandigital}"):
+            return pandigital
     raise ValueError("Failed to find solution")
 
 
@@ -9,23 +9,26 @@ the product of two 2-digit numbers is 9009 = 91 × 99.
 
 Find the largest palindrome made from the product of two 3-digit numbers.
 """
+from .palindromes import palindromes
 from .utils import print_result
 
 
-def is_palindrome(s: str) -> bool:
-    """Return True if input string is palindrome."""
-    return s == s[::-1]
+def largest_palindrome_product(digits: int = 3) -> int:
+    """Find the largest palindrome made from two factors with the given digits."""
+    lo, hi = 10 ** (digits - 1), 10**digits - 1
+    for n in palindromes(hi * hi + 1, descending=True):
+        # Only the larger factor of each pair needs checking
+        for m in range(hi, lo - 1, -1):
+            if m * m < n:
+                break
+            if n % m == 0 and n // m >= lo:
+                return n
+    raise RuntimeError("Failed to find solution")
 
 
 @print_result
 def solve() -> int:
-    res = 0
-    for n in range(999, 100, -1):
-        for m in range(n, 100, -1):
-            prod = m * n
-            if is_palindrome(f"{prod}"):
-                res = max(res, prod)
-    return res
+    return largest_palindrome_product(3)
 
 
 if __name__ == "__main__":
@@ -10,26 +10,32 @@ also prime.
 
 What is the largest n-digit pandigital prime that exists?
 """
-import itertools
-
+from .pandigital import pandigitals
 from .utils import is_prime, print_result
 
 
-def largest_pandigital_prime(n: int = 4) -> int:
-    """Find largest n-digit pandigital prime."""
-    # Get test domain
-    digits = "123456789"[:n]
-    # Find largest pandigital that is prime
-    for perm in itertools.permutations(digits[::-1]):
-        pandigital = int("".join(perm))
-        if is_prime(pandigital):
-            return pandigital
+def largest_pandigital_prime(n: int = 9) -> int:
+    """Find largest pandigital prime with at most n digits."""
+    for size in range(n, 0, -1):
+        # Digit sum divisible by 3 means every pandigital of this size is too
+        if size * (size + 1) // 2 % 3 == 0:
+            continue
+
+        def coprime_to_10(prefix: int, length: int) -> bool:
+            return length < size or prefix % 2 == 1 and prefix % 5 != 0
+
+        # Find largest pandigital that is prime
+        for pandigital in pandigitals(
+            range(1, size + 1), descending=True, prune=coprime_to_10
+        ):
+            if is_prime(pandigital):
+                return pandigital
     raise RuntimeError("Failed to find solution")
 
 
 @print_result
 def solve() -> int:
-    return largest_pandigital_prime(7)
+    return largest_pandigital_prime()
 
 
 if __name__ == "__main__":
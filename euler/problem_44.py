@@ -16,32 +16,22 @@ Find the pair of pentagonal numbers, Pj and Pk, for which their sum and
 difference are pentagonal and D = |Pk − Pj| is minimised; what is the value of
 D?
 """
-import math
+import numpy as np
 
-from .problem_45 import generate_pentagonals
+from .figurate import polygonal_mask, polygonal_numbers
 from .utils import print_result
 
 
-def is_pentagonal(p: int) -> int:
-    """
-    P = n * (3n - 1) / 2
-
-    If P is pentagonal, the above equation will have a positive integer solution
-    for n. We use the quadratic formula to check if either solution for n is a
-    positive integer
-    """
-    root = math.sqrt(24 * p + 1)
-    return root.is_integer() and ((1 + root) / 6).is_integer()
-
-
 @print_result
 def solve() -> int:
-    pentagonals: list[int] = []
-    for p_j in generate_pentagonals(1):
-        for p_k in pentagonals:
-            if is_pentagonal(p_j + p_k) and is_pentagonal(p_j - p_k):
-                return p_j - p_k
-        pentagonals.append(p_j)
+    pentagonals = np.empty(0, dtype=np.int64)
+    for p_j in polygonal_numbers(5):
+        # Test P_j against every smaller pentagonal number at once
+        differences = polygonal_mask(p_j - pentagonals, 5)
+        sums = polygonal_mask(p_j + pentagonals, 5)
+        if (found := differences & sums).any():
+            return int(p_j - pentagonals[found][-1])
+        pentagonals = np.append(pentagonals, p_j)
     raise RuntimeError("Failed to find solution")
 
 
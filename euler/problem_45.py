@@ -15,44 +15,14 @@ It can be verified that T285 = P165 = H143 = 40755.
 
 Find the next triangle number that is also pentagonal and hexagonal.
 """
-from typing import Iterator
-
+from .figurate import common_polygonals
 from .utils import print_result
 
 
-def generate_triangulars(n: int) -> Iterator[int]:
-    """Generate triangular numbers starting from the Nth triangle number."""
-    while True:
-        yield n * (n + 1) // 2
-        n += 1
-
-
-def generate_pentagonals(n: int) -> Iterator[int]:
-    """Generate pentagonal numbers starting from the Nth pentagonal number."""
-    while True:
-        yield n * (3 * n - 1) // 2
-        n += 1
-
-
-def generate_hexagonals(n: int) -> Iterator[int]:
-    """Generate hexagonal numbers starting from the Nth hexagonal number."""
-    while True:
-        yield n * (2 * n - 1)
-        n += 1
-
-
 @print_result
 def solve() -> int:
-    generators = {
-        "t": generate_triangulars(286),
-        "p": generate_pentagonals(166),
-        "h": generate_hexagonals(144),
-    }
-    values = {key: next(generator) for key, generator in generators.items()}
-    while not values["t"] == values["p"] == values["h"]:
-        smallest = min(values, key=values.__getitem__)
-        values[smallest] = next(generators[smallest])
-    return values["t"]
+    # H143 = 40755, and every hexagonal number is also triangular
+    return next(common_polygonals((3, 5, 6), start=144))
 
 
 if __name__ == "__main__":
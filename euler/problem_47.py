@@ -18,39 +18,35 @@ The first three consecutive numbers to have three distinct prime factors are:
 Find the first four consecutive integers to have four distinct prime factors
 each. What is the first of these numbers?
 """
-from functools import lru_cache
-
-from .utils import prime_mask, print_result
-
-MAX = 150_000
+import numpy as np
+
+from .utils import SEGMENT_SIZE, distinct_prime_factor_chunks, print_result
+
+
+def first_run(count: int, segment: int = SEGMENT_SIZE) -> int:
+    """
+    Find the first of COUNT consecutive integers that have COUNT distinct prime
+    factors each, sieving further segments until such a run turns up.
+    """
+    if count < 1:
+        raise ValueError(f"Run length must be positive ({count=})")
+    window = np.ones(count, dtype=np.int64)
+    # Hits from the end of the previous segment that may start a run
+    carry = np.zeros(0, dtype=np.int64)
+    start = 0
+    for chunk in distinct_prime_factor_chunks(0, segment=segment):
+        hits = np.concatenate([carry, chunk == count])
+        runs = np.flatnonzero(np.convolve(hits, window, "valid") == count)
+        if len(runs):
+            return start + int(runs[0])
+        carry = hits[len(hits) - count + 1 :]
+        start += len(hits) - len(carry)
+    raise RuntimeError("Failed to find solution")
 
 
 @print_result
 def solve() -> int:
-    mask = prime_mask(MAX)
-    primes = [2, *(i for i in range(3, MAX, 2) if mask[i])]
-
-    @lru_cache
-    def prime_factors(n: int) -> tuple[int, ...]:
-        """Compute the prime factors of the input integer."""
-        if mask[n] or n == 1:
-            return (n,)
-        for m in primes:
-            if n % m == 0:
-                return (m, *prime_factors(n // m))
-        raise RuntimeError(f"Failed to factorize {n}")
-
-    # Look for N consecutive integers with N distinct prime factors
-    run = 0
-    count = 4
-    for i in range(2, MAX):
-        if len(set(prime_factors(i))) == count:
-            run += 1
-            if run == count:
-                return i - count + 1
-        else:
-            run = 0
-    raise RuntimeError("Failed to find solution")
+    return first_run(4)
 
 
 if __name__ == "__main__":
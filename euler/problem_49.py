@@ -14,41 +14,63 @@ exhibiting this property, but there is one other 4-digit increasing sequence.
 What 12-digit number do you form by concatenating the three terms in this
 sequence?
 """
-from collections import defaultdict
-from typing import Iterator
+from typing import Collection, Iterator
 
-from .utils import prime_mask, print_result
+import numpy as np
+import numpy.typing as npt
 
+from .digits import digit_signature
+from .utils import prime_chunks, print_result
 
-def four_digit_primes() -> Iterator[int]:
-    """Generate all four-digit prime numbers."""
-    primes = prime_mask(9999)
-    for n in range(1001, 9999, 2):
-        if primes[n]:
-            yield n
+Triple = tuple[int, int, int]
 
 
-@print_result
-def solve() -> int:
-    # Find all permutation groups
-    perms = defaultdict(list)
-    for prime in four_digit_primes():
-        digits = tuple(sorted(f"{prime}"))
-        perms[digits].append(prime)
-    # Drop example group
-    del perms[tuple("1478")]
-    # Find evenly spaced 3-group
-    for group in perms.values():
+def signature_groups(values: npt.ArrayLike) -> list[npt.NDArray[np.int64]]:
+    """
+    Group values that are digit permutations of each other. Groups keep the
+    input order and are ordered by their first member.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    signatures = digit_signature(values)
+    _, first, inverse = np.unique(signatures, return_index=True, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse))[:-1]
+    groups = np.split(values[order], bounds)
+    return [groups[i] for i in np.argsort(first)]
+
+
+def arithmetic_triples(group: npt.ArrayLike) -> Iterator[Triple]:
+    """Find the increasing arithmetic sequences of three members of the group."""
+    members = sorted(set(np.asarray(group).tolist()))
+    lookup = set(members)
+    for i, a in enumerate(members):
+        for b in members[i + 1 :]:
+            # The third term is fixed by the first two
+            if 2 * b - a in lookup:
+                yield a, b, 2 * b - a
+
+
+def prime_permutation_sequences(
+    digits: int, exclude: Collection[Triple] = ()
+) -> Iterator[Triple]:
+    """
+    Generate arithmetic sequences of three primes with the given number of
+    digits that are permutations of each other, skipping any in EXCLUDE.
+    """
+    primes = np.concatenate(list(prime_chunks(10 ** (digits - 1), 10**digits)))
+    for group in signature_groups(primes):
         if len(group) < 3:
             continue
-        # Check all 3-groups
-        for i, a in enumerate(group, start=1):
-            for j, b in enumerate(group[i:], start=1):
-                for c in group[i + j :]:
-                    # Evenly spaced
-                    if (b - a) == (c - b):
-                        return int(f"{a}{b}{c}")
-    raise RuntimeError("Failed to find solution")
+        for sequence in arithmetic_triples(group):
+            if sequence not in exclude:
+                yield sequence
+
+
+@print_result
+def solve() -> int:
+    # Skip the example sequence
+    a, b, c = next(prime_permutation_sequences(4, exclude={(1487, 4817, 8147)}))
+    return int(f"{a}{b}{c}")
 
 
 if __name__ == "__main__":
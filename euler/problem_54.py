@@ -57,13 +57,36 @@ How many hands does Player 1 win?
 """
 from __future__ import annotations
 
+import functools
+import itertools
 from collections import Counter
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
 
 from . import DATA_DIR
 from .utils import print_result
 
+# Hand categories from lowest to highest (a royal flush is the best straight flush)
+CATEGORIES = (
+    "high",
+    "pair",
+    "two_pair",
+    "three_of_a_kind",
+    "straight",
+    "flush",
+    "full_house",
+    "four_of_a_kind",
+    "straight_flush",
+)
+# One prime per face, so that the product of a hand's face primes identifies
+# its faces regardless of order
+FACE_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_FACES = 13
+_WHEEL = (0, 1, 2, 3, 12)  # A-2-3-4-5, where the ace plays low
+
 
 class Card:
     """Playing card representation.
@@ -125,141 +148,130 @@ class Card:
         return cls(cls.faces[string[0]], cls.suits[string[-1]])
 
 
+def _rank(faces: tuple[int, ...], flush: bool) -> int:
+    """
+    Rank five faces as ``category * 13^5 + tiebreak``, where the tiebreak lists
+    the faces by how often they occur and then by value, in base 13. Straights
+    are decided by their top card alone.
+    """
+    counts = Counter(faces)
+    groups = sorted(counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    pattern = tuple(count for _, count in groups)
+    straight = len(counts) == 5 and (max(faces) - min(faces) == 4 or faces == _WHEEL)
+    if straight:
+        category = "straight_flush" if flush else "straight"
+        return CATEGORIES.index(category) * _FACES**5 + (
+            3 if faces == _WHEEL else max(faces)
+        )
+    if flush:
+        category = "flush"
+    else:
+        category = {
+            (4, 1): "four_of_a_kind",
+            (3, 2): "full_house",
+            (3, 1, 1): "three_of_a_kind",
+            (2, 2, 1): "two_pair",
+            (2, 1, 1, 1): "pair",
+        }.get(pattern, "high")
+    tiebreak = 0
+    for face, count in groups:
+        for _ in range(count):
+            tiebreak = tiebreak * _FACES + face
+    return CATEGORIES.index(category) * _FACES**5 + tiebreak
+
+
+@functools.lru_cache
+def _rank_tables() -> (
+    tuple[
+        dict[int, int],
+        npt.NDArray[np.int64],
+        npt.NDArray[np.int64],
+        npt.NDArray[np.int64],
+    ]
+):
+    """
+    Precompute the rank of every hand: non-flush hands keyed by the product of
+    their face primes (as a dict, and as sorted arrays for vectorised lookups),
+    and flushes indexed by the bitmask of their faces.
+    """
+    products = {}
+    flushes = np.zeros(1 << _FACES, dtype=np.int64)
+    for faces in itertools.combinations_with_replacement(range(_FACES), 5):
+        if max(Counter(faces).values()) > 4:
+            continue
+        products[int(np.prod([FACE_PRIMES[f] for f in faces]))] = _rank(faces, False)
+        if len(set(faces)) == 5:
+            flushes[sum(1 << f for f in faces)] = _rank(faces, True)
+    keys = np.array(sorted(products), dtype=np.int64)
+    ranks = np.array([products[k] for k in keys.tolist()], dtype=np.int64)
+    return products, keys, ranks, flushes
+
+
+def hand_rank(faces: Sequence[int], suits: Sequence[int]) -> int:
+    """
+    Rank a five card hand, given the face and suit values of its cards, so that
+    a better hand (including kickers) always has a higher rank.
+    """
+    products, _, _, flushes = _rank_tables()
+    if len(set(suits)) == 1:
+        return int(flushes[sum(1 << f for f in faces)])
+    product = 1
+    for f in faces:
+        product *= FACE_PRIMES[f]
+    return products[product]
+
+
+def rank_hands(faces: npt.ArrayLike, suits: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Rank many hands at once (see ``hand_rank``), one hand per row."""
+    _, keys, ranks, flushes = _rank_tables()
+    faces = np.asarray(faces, dtype=np.int64)
+    suits = np.asarray(suits)
+    products = np.prod(np.array(FACE_PRIMES, dtype=np.int64)[faces], axis=-1)
+    result: npt.NDArray[np.int64] = ranks[np.searchsorted(keys, products)]
+    flush = (suits == suits[..., :1]).all(axis=-1)
+    masks = np.bitwise_or.reduce(np.left_shift(1, faces[flush]), axis=-1)
+    result[flush] = flushes[masks]
+    return result
+
+
 class Hand:
     """Poker hand representation.
 
-    Contains a list of 5 Card objects. Allows ordering operations between hands.
+    Contains a list of 5 Card objects. Allows ordering operations between hands,
+    which compare a single precomputed integer rank.
     """
 
-    _faces_descending = range(len(Card.faces))[::-1]
-    _suits_descending = range(len(Card.suits))[::-1]
-
-    __slots__ = ("cards", "_face_counts", "_suit_counts")
+    __slots__ = ("cards", "_rank")
 
     def __init__(self, *cards: Card) -> None:
         # Cards are sorted in descending order; max is always first card
         self.cards = sorted(cards, reverse=True)
-        self._face_counts: Optional[Counter[int]] = None
-        self._suit_counts: Optional[Counter[int]] = None
-
-    @property
-    def face_counts(self) -> Counter[int]:
-        if self._face_counts is None:
-            self._face_counts = Counter(c.face_value for c in self.cards)
-        return self._face_counts
+        self._rank: Optional[int] = None
 
     @property
-    def suit_counts(self) -> Counter[int]:
-        if self._suit_counts is None:
-            self._suit_counts = Counter(c.suit_value for c in self.cards)
-        return self._suit_counts
-
-    def get_where(
-        self, face: Optional[int] = None, suit: Optional[int] = None
-    ) -> Iterator[Card]:
-        """Get cards that match the input face and suit.
-
-        Yields:
-            Matches in descending order.
-        """
-        for card in self.cards:
-            if (face is None or card.face_value == face) and (
-                suit is None or card.suit_value == suit
-            ):
-                yield card
-
-    def eval_high(self) -> Card:
-        return self.cards[0]
-
-    def eval_pair(self) -> Optional[Card]:
-        for face in self._faces_descending:
-            if self.face_counts[face] == 2:
-                return next(self.get_where(face=face))
-        return None
-
-    def eval_two_pair(self) -> Optional[Card]:
-        counts = list(self.face_counts.values())
-        if counts.count(2) >= 2:
-            return self.eval_pair()
-        return None
-
-    def eval_three_of_a_kind(self) -> Optional[Card]:
-        for face in self._faces_descending:
-            if self.face_counts[face] == 3:
-                return next(self.get_where(face=face))
-        return None
-
-    def eval_straight(self) -> Optional[Card]:
-        faces = sorted((c.face_value for c in self.cards), reverse=True)
-        for a, b in zip(faces, faces[1:]):
-            if b != (a - 1):
-                return None
-        return self.cards[0]
-
-    def eval_flush(self) -> Optional[Card]:
-        for suit in self._suits_descending:
-            if self.suit_counts[suit] == 5:
-                return self.cards[0]
-        return None
-
-    def eval_full_house(self) -> Optional[Card]:
-        counts = self.face_counts.values()
-        if 3 in counts and 2 in counts:
-            return self.eval_three_of_a_kind()
-        return None
-
-    def eval_four_of_a_kind(self) -> Optional[Card]:
-        for face in self._faces_descending:
-            if self.face_counts[face] == 4:
-                return next(self.get_where(face=face))
-        return None
-
-    def eval_straight_flush(self) -> Optional[Card]:
-        if self.eval_straight() and self.eval_flush():
-            return self.cards[0]
-        return None
-
-    def eval_royal_flush(self) -> Optional[Card]:
-        if self.eval_straight_flush():
-            if self.cards[0].face_value == Card.faces["A"]:
-                return self.cards[0]
-        return None
-
-    hierarchy = [
-        eval_royal_flush,
-        eval_straight_flush,
-        eval_four_of_a_kind,
-        eval_full_house,
-        eval_flush,
-        eval_straight,
-        eval_three_of_a_kind,
-        eval_two_pair,
-        eval_pair,
-        eval_high,
-    ]
+    def rank(self) -> int:
+        if self._rank is None:
+            self._rank = hand_rank(
+                [c.face_value for c in self.cards], [c.suit_value for c in self.cards]
+            )
+        return self._rank
 
     def get_best(self) -> str:
         """Get best card set from hand."""
-        for method in self.hierarchy:
-            if method(self) is not None:
-                return method.__name__.lstrip("eval_")
-        raise RuntimeError("Failed to get best card set")
+        category, tiebreak = divmod(self.rank, _FACES**5)
+        if CATEGORIES[category] == "straight_flush" and tiebreak == Card.faces["A"]:
+            return "royal_flush"
+        return CATEGORIES[category]
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, Hand):
             return NotImplemented
-        for method in self.hierarchy:
-            res_s = method(self)
-            res_o = method(other)
-            if res_s is None:
-                if res_o is None:
-                    continue
-                return False
-            if res_s > res_o:
-                return True
-            if res_s < res_o:
-                return False
-        return False
+        return self.rank > other.rank
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return self.rank < other.rank
 
     def __bool__(self) -> bool:
         return bool(self.cards)
@@ -35,23 +35,89 @@ How many Lychrel numbers are there below ten-thousand?
 NOTE: Wording was modified slightly on 24 April 2007 to emphasise the
 theoretical nature of Lychrel numbers.
 """
-from .problem_4 import is_palindrome
-from .utils import print_result
-
-MAX_DEPTH = 50
+import numpy as np
+import numpy.typing as npt
 
+from .digits import reverse_digits
+from .palindromes import is_palindrome, reverse
+from .utils import BoundedCache, print_result
 
-def is_lychrel(n: int) -> bool:
-    for _ in range(MAX_DEPTH):
-        n += int(f"{n}"[::-1])
-        if is_palindrome(f"{n}"):
-            return False
-    return True
+MAX_DEPTH = 50
+# Largest int64 value whose reverse-and-add sum cannot overflow
+_INT64_SAFE = 10**18 - 1
+
+# Reverse-and-add steps from a value to a palindrome: positive values are exact
+# step counts, negative values -k record that none was found within k steps
+LYCHREL_CACHE: BoundedCache[int, int] = BoundedCache(maxsize=1 << 16)
+
+
+def lychrel_depth(n: int, depth: int = MAX_DEPTH) -> int:
+    """
+    Count the reverse-and-add iterations N takes to reach a palindrome, or
+    return 0 if it does not get there within ``depth`` iterations (a Lychrel
+    number). Chains are memoised in ``LYCHREL_CACHE``, so seeds that merge onto
+    an already explored chain stop early.
+    """
+    path: list[int] = []
+    value = n
+    last = 0  # steps recorded for the last value on the path (see above)
+    while len(path) < depth:
+        known = LYCHREL_CACHE.get(value)
+        if known is not None and (known > 0 or -known >= depth - len(path)):
+            if not path:
+                return known if 0 < known <= depth else 0
+            last = known + 1 if known > 0 else known - 1
+            break
+        path.append(value)
+        value += reverse(value)
+        if is_palindrome(value):
+            last = 1
+            break
+    else:
+        last = -1
+    # Each earlier value on the path is one more step away
+    sign = 1 if last > 0 else -1
+    for i, v in enumerate(reversed(path)):
+        LYCHREL_CACHE.put(v, last + sign * i)
+    if last < 0:
+        return 0
+    total = last + len(path) - 1
+    return total if total <= depth else 0
+
+
+def lychrel_depths(
+    start: int, stop: int, depth: int = MAX_DEPTH
+) -> npt.NDArray[np.int64]:
+    """
+    Get ``lychrel_depth`` for every seed in ``range(start, stop)``.
+
+    All seeds take their reverse-and-add steps together as one int64 array,
+    dropping out as they reach a palindrome. Seeds whose values could overflow
+    int64 finish their chains through the memoised ``lychrel_depth``.
+    """
+    depths = np.zeros(max(stop - start, 0), dtype=np.int64)
+    alive = np.arange(len(depths))
+    values = np.arange(start, start + len(depths), dtype=np.int64)
+    step = 0
+    while len(alive) and step < depth:
+        safe = values <= _INT64_SAFE
+        if not safe.all():
+            # Hand the largest values over to the scalar engine
+            for i, value in zip(alive[~safe].tolist(), values[~safe].tolist()):
+                if remaining := lychrel_depth(value, depth - step):
+                    depths[i] = step + remaining
+            alive, values = alive[safe], values[safe]
+        step += 1
+        values = values + reverse_digits(values)
+        palindrome = values == reverse_digits(values)
+        depths[alive[palindrome]] = step
+        alive, values = alive[~palindrome], values[~palindrome]
+    return depths
 
 
 @print_result
 def solve() -> int:
-    return len([n for n in range(10_000) if is_lychrel(n)])
+    return int((lychrel_depths(0, 10_000) == 0).sum())
 
 
 if __name__ == "__main__":
@@ -16,25 +16,23 @@ concatenate to produce another prime.
 from collections import defaultdict
 from typing import Iterator
 
-from .utils import is_prime, prime_list, print_result
+import numpy as np
 
-
-def concats_prime(m: int, n: int) -> bool:
-    """Return True if inputs concatenate to a prime."""
-    return is_prime(int(f"{m}{n}")) and is_prime(int(f"{n}{m}"))
+from .digits import concat
+from .utils import is_prime_many, prime_chunks, print_result
 
 
 def generate_graph(node_max: int) -> defaultdict[int, set[int]]:
     """Build graph of pairs of 'substring' primes in the prime table."""
     graph = defaultdict(set)
-    primes = prime_list(node_max)
-    for i in range(len(primes)):
-        for j in range(i, len(primes)):
-            p = primes[i]
-            q = primes[j]
-            if concats_prime(p, q):
-                graph[p].add(q)
-                graph[q].add(p)
+    nodes = np.concatenate(list(prime_chunks(2, node_max)))
+    for i, q in enumerate(nodes.tolist()):
+        # Test the new node against every earlier node at once
+        earlier = nodes[:i]
+        pairs = is_prime_many(concat(earlier, q)) & is_prime_many(concat(q, earlier))
+        for p in earlier[pairs].tolist():
+            graph[p].add(q)
+            graph[q].add(p)
     return graph
 
 
@@ -25,19 +25,12 @@ integer sided right angle triangles.
 Given that L is the length of the wire, for how many values of L ≤ 1,500,000 can
 exactly one integer sided right angle triangle be formed?
 """
-import collections
-import math
-
-from .utils import generate_triples, print_result
+from .utils import print_result, triple_perimeter_counts
 
 
 @print_result
 def solve() -> int:
-    length = 1_500_000
-    perims = collections.Counter(
-        (sum(sides) for sides in generate_triples(math.ceil(length / 2)))
-    )
-    return sum(1 for p, count in perims.items() if p <= length and count == 1)
+    return int((triple_perimeter_counts(1_500_000) == 1).sum())
 
 
 if __name__ == "__main__":
@@ -1,12 +1,30 @@
 # -*- coding: utf-8 -*-
 """Shared utility functions."""
 import atexit
+import collections
+import contextlib
 import functools
+import itertools
 import math
+import os
+import sys
+import tempfile
 import time
 import warnings
 from pathlib import Path
-from typing import Any, Callable, Iterator, TypeVar, Union, cast
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import numpy as np
 import numpy.typing as npt
@@ -39,14 +57,99 @@ def print_result(func: Solver, verbose: bool = False) -> Solver:
     return cast(Solver, wrapper)
 
 
+###############################################################################
+# CACHING
+###############################################################################
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+EvictionPolicy = Literal["lru", "fifo"]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class BoundedCache(Generic[K, V]):
+    """Size-bounded memo table that records hit, miss and eviction counts.
+
+    When full, the least recently used (``"lru"``) or the oldest inserted
+    (``"fifo"``) entry is evicted to make room.
+    """
+
+    def __init__(self, maxsize: int, policy: EvictionPolicy = "lru") -> None:
+        self._data: collections.OrderedDict[K, V] = collections.OrderedDict()
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: K) -> V | None:
+        """Get the cached value for the key, or None on a miss."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.policy == "lru":
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Cache the value, evicting entries if the cache is full."""
+        self._data[key] = value
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def configure(
+        self, maxsize: int | None = None, policy: EvictionPolicy | None = None
+    ) -> None:
+        """Change the size bound and/or the eviction policy."""
+        if maxsize is not None:
+            self.maxsize = maxsize
+            self._evict()
+        if policy is not None:
+            self.policy = policy
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._data)
+        )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 ###############################################################################
 # PRIMES
 ###############################################################################
 CACHE_DIR = Path(__file__).parent / "cache"
 CACHE_IGNORE = CACHE_DIR / ".gitignore"
-CACHE_PRIMES = CACHE_DIR / ".primes.npy"
-_PRIME_MASK: npt.NDArray[np.bool_] | None = None
+CACHE_PRIMES = CACHE_DIR / ".primes.bin"
+CACHE_PRIMES_LEGACY = CACHE_DIR / ".primes.npy"
+CACHE_LOCK = CACHE_DIR / ".primes.lock"
+# Cache layout: magic, little-endian uint64 mask length, then one bit per odd
+# number (bit i of the body is set if 2i + 1 is prime, little bit order)
+_CACHE_MAGIC = b"EULERPR1"
+_CACHE_HEADER = len(_CACHE_MAGIC) + 8
+_PRIME_MASK: npt.NDArray[np.bool_] = np.zeros(2, dtype=np.bool_)
 _PRIME_MASK_CHANGED = False
+_PRIME_BITS: npt.NDArray[np.uint8] | None = None
+_PRIME_BITS_N = 0
+SEGMENT_SIZE = 1 << 20
 
 
 def _cache_init() -> None:
@@ -55,103 +158,650 @@ def _cache_init() -> None:
         CACHE_IGNORE.write_text("*")
 
 
-def _cache_read() -> npt.NDArray[np.bool_]:
-    if CACHE_PRIMES.exists():
-        return cast(npt.NDArray[np.bool_], np.load(CACHE_PRIMES))
-    return np.zeros(2, dtype=np.bool_)
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(h: IO[bytes]) -> None:
+        msvcrt.locking(h.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock(h: IO[bytes]) -> None:
+        msvcrt.locking(h.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(h: IO[bytes]) -> None:
+        fcntl.flock(h.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(h: IO[bytes]) -> None:
+        fcntl.flock(h.fileno(), fcntl.LOCK_UN)
+
+
+@contextlib.contextmanager
+def _cache_lock() -> Iterator[None]:
+    """Hold an exclusive lock on the prime cache across processes."""
+    _cache_init()
+    with CACHE_LOCK.open("wb") as h:
+        _lock(h)
+        try:
+            yield
+        finally:
+            _unlock(h)
+
+
+def _pack(mask: npt.NDArray[np.bool_]) -> npt.NDArray[np.uint8]:
+    """Pack the odd indices of a prime mask into bits."""
+    return np.packbits(mask[1::2], bitorder="little")
+
+
+def _unpack(bits: npt.NDArray[np.uint8], n: int) -> npt.NDArray[np.bool_]:
+    """Unpack the first N indices of a prime mask from odd-only bits."""
+    odd = n // 2
+    mask = np.zeros(n, dtype=np.bool_)
+    mask[1::2] = np.unpackbits(bits[: -(-odd // 8)], count=odd, bitorder="little")
+    mask[2:3] = True
+    return mask
+
+
+def _cache_length() -> int | None:
+    """Read the mask length from the cache header; None if it is not valid."""
+    if not CACHE_PRIMES.exists():
+        return None
+    with CACHE_PRIMES.open("rb") as h:
+        header = h.read(_CACHE_HEADER)
+        size = os.fstat(h.fileno()).st_size
+    if len(header) == _CACHE_HEADER and header.startswith(_CACHE_MAGIC):
+        n = int.from_bytes(header[len(_CACHE_MAGIC) :], "little")
+        # A length beyond the end of the file means a corrupt header
+        if size >= _CACHE_HEADER + -(-(n // 2) // 8):
+            return n
+    warnings.warn(f"Ignoring invalid prime cache ({CACHE_PRIMES})")
+    return None
+
+
+def _cache_replace(mask: npt.NDArray[np.bool_]) -> None:
+    """Atomically replace the cache file with the input mask."""
+    with tempfile.NamedTemporaryFile(dir=CACHE_DIR, delete=False) as h:
+        try:
+            h.write(_CACHE_MAGIC)
+            h.write(len(mask).to_bytes(8, "little"))
+            h.write(_pack(mask).tobytes())
+            h.flush()
+            os.fsync(h.fileno())
+        except BaseException:
+            h.close()
+            os.unlink(h.name)
+            raise
+    os.replace(h.name, CACHE_PRIMES)
+
+
+def _cache_append(mask: npt.NDArray[np.bool_], cached: int) -> None:
+    """
+    Extend a valid cache file of length ``cached`` in place, writing only the
+    bytes that hold the new odd numbers. The header is updated last, so a crash
+    mid-write leaves the existing cache intact.
+    """
+    start = (cached // 2) // 8  # byte holding the first new bit
+    with CACHE_PRIMES.open("r+b") as h:
+        h.seek(_CACHE_HEADER + start)
+        h.write(_pack(mask[16 * start :]).tobytes())
+        h.flush()
+        os.fsync(h.fileno())
+        h.seek(len(_CACHE_MAGIC))
+        h.write(len(mask).to_bytes(8, "little"))
+        h.flush()
+        os.fsync(h.fileno())
+
+
+def _cache_migrate() -> None:
+    """Convert a legacy ``.npy`` byte-per-integer cache to the packed format."""
+    with _cache_lock():
+        if CACHE_PRIMES.exists() or not CACHE_PRIMES_LEGACY.exists():
+            return  # migrated by another process
+        warnings.warn(
+            f"Migrating prime cache ({CACHE_PRIMES_LEGACY} -> {CACHE_PRIMES})"
+        )
+        _cache_replace(np.load(CACHE_PRIMES_LEGACY, mmap_mode="r"))
+        CACHE_PRIMES_LEGACY.unlink()
+
+
+def _cache_read() -> tuple[npt.NDArray[np.uint8], int]:
+    """Memory-map the packed prime cache, returning its bits and mask length."""
+    if not CACHE_PRIMES.exists() and CACHE_PRIMES_LEGACY.exists():
+        _cache_migrate()
+    if (n := _cache_length()) and (size := -(-(n // 2) // 8)):
+        bits = np.memmap(
+            CACHE_PRIMES,
+            dtype=np.uint8,
+            mode="r",
+            offset=_CACHE_HEADER,
+            shape=(size,),
+        )
+        return cast(npt.NDArray[np.uint8], bits), n
+    return np.zeros(0, dtype=np.uint8), 0
+
+
+def _cached_bits() -> tuple[npt.NDArray[np.uint8], int]:
+    """Get the packed prime cache, mapping it from disk on first use."""
+    global _PRIME_BITS, _PRIME_BITS_N
+    if _PRIME_BITS is None:
+        _PRIME_BITS, _PRIME_BITS_N = _cache_read()
+    return _PRIME_BITS, _PRIME_BITS_N
 
 
 @atexit.register
 def _cache_write() -> None:
-    if _PRIME_MASK_CHANGED and _PRIME_MASK is not None:
+    global _PRIME_BITS
+    if not _PRIME_MASK_CHANGED:
+        return
+    with _cache_lock():
+        # Another process may have grown the cache since it was mapped
+        cached = _cache_length()
+        if cached is not None and cached >= len(_PRIME_MASK):
+            return
         warnings.warn(f"Writing prime cache (n={len(_PRIME_MASK)}, {CACHE_PRIMES})")
-        _cache_init()
-        np.save(CACHE_PRIMES, _PRIME_MASK)
+        # Release the mapping before the file is modified
+        _PRIME_BITS = None
+        if cached:
+            _cache_append(_PRIME_MASK, cached)
+        else:
+            _cache_replace(_PRIME_MASK)
+
+
+def _sieve(mask: npt.NDArray[np.bool_], n: int) -> npt.NDArray[np.bool_]:
+    """
+    Extend a valid prime mask up to length N, sieving only the indices that
+    are not already covered by the input mask.
+    """
+    start = len(mask)
+    if start >= n:
+        return mask
+    # Sieving [start, n) requires every prime up to sqrt(n)
+    root = math.isqrt(n - 1)
+    if start <= root < n - 1:
+        mask = _sieve(mask, root + 1)
+        start = len(mask)
+    extended = np.ones(n, dtype=np.bool_)
+    extended[:start] = mask
+    extended[start:2] = False  # 0 and 1
+    extended[max(4, start + start % 2) :: 2] = False
+    for p in np.flatnonzero(mask[3 : root + 1 : 2]) * 2 + 3:
+        p = int(p)
+        # First odd multiple of p in the new range, and no smaller than p^2
+        first = max(p * p, -(-start // p) * p)
+        if first % 2 == 0:
+            first += p
+        extended[first :: 2 * p] = False
+    return extended
 
 
 def prime_mask(n: int) -> np.ndarray:
     """Generate boolean array of length N, where prime indices are True."""
     global _PRIME_MASK, _PRIME_MASK_CHANGED
-    if _PRIME_MASK is None:
-        _PRIME_MASK = _cache_read()
-    if (alloc := n - len(_PRIME_MASK)) > 0:
-        warnings.warn(f"Cache miss on prime mask ({n=}, cached={len(_PRIME_MASK)})")
+    if n <= len(_PRIME_MASK):
+        return _PRIME_MASK
+    # Unpack only as much of the disk cache as is needed
+    bits, cached = _cached_bits()
+    mask = _PRIME_MASK
+    if len(mask) < cached:
+        mask = _unpack(bits, min(n, cached))
+    if n > len(mask):
+        warnings.warn(f"Cache miss on prime mask ({n=}, {cached=})")
         # Extend prime mask up to N
-        _PRIME_MASK = np.pad(_PRIME_MASK, (0, alloc), constant_values=True)
-        _PRIME_MASK.flags.writeable = True
-        for i in range(2, n):
-            if _PRIME_MASK[i]:
-                # Mark all multiples of i as composite
-                composite = 2 * i
-                while composite < n:
-                    _PRIME_MASK[composite] = False
-                    composite += i
-
+        mask = _sieve(mask, n)
         # Ensure cache remains valid
         _PRIME_MASK_CHANGED = True
-        _PRIME_MASK.flags.writeable = False
-    return _PRIME_MASK
+    mask.flags.writeable = False
+    _PRIME_MASK = mask
+    return mask
 
 
 def prime_list(n: int) -> list[int]:
     """Generate a list of all primes below the input number."""
-    mask = prime_mask(n)
-    if n <= 2:
-        return []
-    return [2, *(i for i in range(3, n, 2) if mask[i])]
+    return cast(list[int], np.flatnonzero(prime_mask(n)[: max(n, 0)]).tolist())
 
 
-@functools.lru_cache
-def is_prime(n: int) -> bool:
-    """Return True if the input is prime."""
-    mask = _PRIME_MASK if _PRIME_MASK is not None else _cache_read()
-    if n < len(mask):
-        return cast(bool, mask[n])
-    if n % 2 == 0 or n % 3 == 0:
-        return n == 3  # 1 and 2 are guaranteed covered by the mask
-    for i in range(5, math.floor(math.sqrt(n)) + 1, 6):
-        if n % i == 0 or n % (i + 2) == 0:
+def prime_chunks(
+    lo: int, hi: int, segment: int = SEGMENT_SIZE
+) -> Iterator[npt.NDArray[np.int64]]:
+    """
+    Generate arrays of the primes in ``[lo, hi)`` in ascending order, sieving
+    one segment of (at most) ``segment`` integers at a time.
+
+    Memory use is proportional to ``sqrt(hi) + segment``, so windows far beyond
+    the reach of ``prime_mask`` can be streamed.
+    """
+    if hi <= max(lo, 2):
+        return
+    # Base primes up to sqrt(hi); reuse the in-memory mask when it is big enough
+    root = math.isqrt(hi - 1)
+    if root < max(len(_PRIME_MASK), _cached_bits()[1]):
+        mask = prime_mask(root + 1)
+    else:
+        mask = _sieve(_PRIME_MASK, root + 1)
+    base = (np.flatnonzero(mask[3 : root + 1 : 2]) * 2 + 3).tolist()
+    if lo <= 2:
+        yield np.array([2], dtype=np.int64)
+    # Segments hold odd numbers only; keep the segment span even so that every
+    # segment starts on an odd number
+    segment += segment % 2
+    for seg_lo in range(max(lo, 3) | 1, hi, segment):
+        seg_hi = min(seg_lo + segment, hi)
+        odd = np.ones((seg_hi - seg_lo + 1) // 2, dtype=np.bool_)
+        for p in base:
+            if p * p >= seg_hi:
+                break
+            first = max(p * p, -(-seg_lo // p) * p)
+            if first % 2 == 0:
+                first += p
+            odd[(first - seg_lo) // 2 :: p] = False
+        if seg_lo == 1:
+            odd[0] = False
+        yield np.flatnonzero(odd) * 2 + seg_lo
+
+
+def iter_primes(lo: int, hi: int, segment: int = SEGMENT_SIZE) -> Iterator[int]:
+    """Generate all primes in ``[lo, hi)`` using a bounded-memory segmented sieve."""
+    for chunk in prime_chunks(lo, hi, segment):
+        yield from chunk.tolist()
+
+
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+# Miller-Rabin is deterministic below each bound when using the paired witnesses
+# https://en.wikipedia.org/wiki/Miller%E2%80%93Rabin_primality_test#Testing_against_small_sets_of_bases
+_WITNESSES = (
+    (2_047, _SMALL_PRIMES[:1]),
+    (1_373_653, _SMALL_PRIMES[:2]),
+    (25_326_001, _SMALL_PRIMES[:3]),
+    (3_215_031_751, _SMALL_PRIMES[:4]),
+    (2_152_302_898_747, _SMALL_PRIMES[:5]),
+    (3_474_749_660_383, _SMALL_PRIMES[:6]),
+    (341_550_071_728_321, _SMALL_PRIMES[:7]),
+    (3_825_123_056_546_413_051, _SMALL_PRIMES[:9]),
+    (318_665_857_834_031_151_167_461, _SMALL_PRIMES[:12]),
+    (3_317_044_064_679_887_385_961_981, _SMALL_PRIMES[:13]),
+)
+
+
+def is_strong_probable_prime(n: int, witnesses: tuple[int, ...]) -> bool:
+    """
+    Return True if odd ``n > 2`` is a strong probable prime to every witness
+    base (one Miller-Rabin round per witness).
+    """
+    s = ((n - 1) & (1 - n)).bit_length() - 1
+    d = (n - 1) >> s
+    for a in witnesses:
+        if (x := pow(a, d, n)) in (0, 1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
     return True
 
 
+def _is_prime_unsieved(n: int) -> bool:
+    """Primality test for inputs that are not covered by the prime cache."""
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < _SMALL_PRIMES[-1] ** 2:
+        return n > 1
+    for bound, witnesses in _WITNESSES:
+        if n < bound:
+            return is_strong_probable_prime(n, witnesses)
+    # Beyond the largest deterministic bound this is a strong probable prime test
+    return is_strong_probable_prime(n, witnesses)
+
+
+# Memoizes is_prime results for inputs that the prime cache does not cover
+IS_PRIME_CACHE: BoundedCache[int, bool] = BoundedCache(maxsize=1 << 16)
+
+
+def is_prime(n: int) -> bool:
+    """
+    Return True if the input is prime.
+
+    Inputs outside the prime cache use deterministic Miller-Rabin, which is
+    exact below ~3.3e24; larger inputs get a strong probable prime test.
+    Only those results are memoized (see ``IS_PRIME_CACHE``).
+    """
+    if n < 2:
+        return False
+    if n < len(_PRIME_MASK):
+        return cast(bool, _PRIME_MASK[n])
+    bits, cached = _cached_bits()
+    if n < cached:
+        # Odd-only bit lookup pages in a single byte of the disk cache
+        i = n // 2
+        return n == 2 or n % 2 == 1 and bool(bits[i // 8] >> (i % 8) & 1)
+    if (result := IS_PRIME_CACHE.get(n)) is None:
+        result = _is_prime_unsieved(n)
+        IS_PRIME_CACHE.put(n, result)
+    return result
+
+
+def _miller_rabin_many(n: npt.NDArray[np.uint64]) -> npt.NDArray[np.bool_]:
+    """
+    Vectorised deterministic Miller-Rabin for odd ``47^2 <= n < 2^32``; every
+    product of two residues fits in a uint64.
+    """
+    d = n - 1
+    s = np.zeros(n.shape, dtype=np.uint64)
+    while (even := (d & 1) == 0).any():
+        d[even] >>= 1
+        s[even] += 1
+    result = np.ones(n.shape, dtype=np.bool_)
+    for a in _SMALL_PRIMES[:5]:
+        x = np.ones_like(n)
+        base = np.full_like(n, a)
+        e = d.copy()
+        while e.any():
+            x = np.where(e & 1 == 1, x * base % n, x)
+            base = base * base % n
+            e >>= 1
+        passed = (x == 1) | (x == n - 1)
+        for r in range(1, int(s.max())):
+            x = x * x % n
+            passed |= (x == n - 1) & (r < s)
+        result &= passed
+    return result
+
+
+def is_prime_many(values: npt.ArrayLike) -> npt.NDArray[np.bool_]:
+    """Test an array of integers for primality in one call."""
+    values = np.asarray(values)
+    flat = values.ravel()
+    result = np.zeros(flat.shape, dtype=np.bool_)
+    if flat.size == 0:
+        return result.reshape(values.shape)
+    if flat.dtype == object:
+        # Python ints that may not fit in 64 bits
+        result[:] = [is_prime(int(n)) for n in flat]
+        return result.reshape(values.shape)
+    # Values covered by the in-memory mask, then by the packed disk cache
+    bits, cached = _cached_bits()
+    covered = (flat >= 0) & (flat < len(_PRIME_MASK))
+    result[covered] = _PRIME_MASK[flat[covered].astype(np.intp)]
+    if cached > len(_PRIME_MASK):
+        packed = (flat >= len(_PRIME_MASK)) & (flat < cached)
+        i = flat[packed].astype(np.intp) // 2
+        odd = flat[packed] % 2 == 1
+        result[packed] = (flat[packed] == 2) | odd & (bits[i // 8] >> (i % 8) & 1 == 1)
+        covered |= packed
+    # Trial division by small primes, then Miller-Rabin on the survivors
+    rest = np.flatnonzero(~covered & (flat > 1))
+    candidates = flat[rest]
+    unknown = np.ones(candidates.shape, dtype=np.bool_)
+    for p in _SMALL_PRIMES:
+        divisible = candidates % p == 0
+        result[rest[divisible & (candidates == p)]] = True
+        unknown &= ~divisible
+    small = unknown & (candidates < _SMALL_PRIMES[-1] ** 2)
+    result[rest[small]] = True
+    unknown &= ~small
+    native = unknown & (candidates < 1 << 32)
+    if native.any():
+        native_values = candidates[native].astype(np.uint64)
+        result[rest[native]] = _miller_rabin_many(native_values)
+    for j in np.flatnonzero(unknown & ~native):
+        result[rest[j]] = _is_prime_unsieved(int(candidates[j]))
+    return result.reshape(values.shape)
+
+
+###############################################################################
+# FACTORIZATION
+###############################################################################
+_SPF: npt.NDArray[np.int32] = np.arange(2, dtype=np.int32)
+# Largest smallest-prime-factor table kept in memory (64 MiB of int32); larger
+# values are factorized by trial division
+SPF_MAX = 1 << 24
+
+
+def _spf_extend(spf: npt.NDArray[np.int32], n: int) -> npt.NDArray[np.int32]:
+    """Extend a smallest prime factor table up to length N."""
+    start = len(spf)
+    extended = np.empty(n, dtype=np.int32)
+    extended[:start] = spf
+    extended[start:] = np.arange(start, n)
+    # Largest primes first, so the smallest factor is the one left standing
+    for p in reversed(prime_list(math.isqrt(n - 1) + 1)):
+        first = max(p * p, -(-start // p) * p)
+        extended[first::p] = p
+    return extended
+
+
+def smallest_prime_factors(n: int) -> npt.NDArray[np.int32]:
+    """
+    Get a table of length (at least) N, where each index holds its smallest
+    prime factor. Indices 0 and 1 hold themselves. N may not exceed ``SPF_MAX``.
+    """
+    global _SPF
+    if n > SPF_MAX:
+        raise ValueError(f"Smallest prime factor table is limited to {SPF_MAX=} ({n=})")
+    if n > len(_SPF):
+        # Grow geometrically so that repeated small requests stay cheap
+        _SPF = _spf_extend(_SPF, min(max(n, 2 * len(_SPF)), SPF_MAX))
+        _SPF.flags.writeable = False
+    return _SPF
+
+
+def factorize(n: int) -> dict[int, int]:
+    """Get the prime factorization of a positive integer as ``{prime: power}``."""
+    if n < 1:
+        raise ValueError(f"Cannot factorize {n}")
+    if n >= SPF_MAX:
+        return _factorize_unsieved(n)
+    spf = smallest_prime_factors(n + 1)
+    factors: dict[int, int] = {}
+    while n > 1:
+        p = int(spf[n])
+        factors[p] = factors.get(p, 0) + 1
+        n //= p
+    return factors
+
+
+def _factorize_unsieved(n: int) -> dict[int, int]:
+    """Factorize N by trial division, for inputs beyond the factor table."""
+    factors: dict[int, int] = {}
+    for p in iter_primes(2, math.isqrt(n) + 1):
+        if p * p > n:
+            break
+        if n % p:
+            continue
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+        if is_prime(n):
+            break
+    if n > 1:
+        # Whatever remains is a single prime
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def _prime_powers(
+    values: npt.NDArray[np.int64],
+) -> Iterator[
+    tuple[npt.NDArray[np.intp], npt.NDArray[np.int64], npt.NDArray[np.int64]]
+]:
+    """
+    Strip the smallest prime power from every value each round, yielding the
+    ``(indices, primes, exponents)`` of the values that were reduced.
+    """
+    # Values beyond the factor table are factorized one at a time
+    for i in np.flatnonzero(values >= SPF_MAX):
+        for prime, power in factorize(int(values[i])).items():
+            yield np.array([i]), np.array([prime]), np.array([power])
+    values = np.where(values < SPF_MAX, values, 0)
+    spf = smallest_prime_factors(int(values.max(initial=1)) + 1)
+    idx = np.flatnonzero(values > 1)
+    rem = values[idx]
+    while idx.size:
+        p = spf[rem].astype(np.int64)
+        rem //= p
+        e = np.ones_like(rem)
+        # Only the (few) values with repeated factors need further division
+        repeat = np.flatnonzero(spf[rem] == p)
+        while repeat.size:
+            rem[repeat] //= p[repeat]
+            e[repeat] += 1
+            repeat = repeat[spf[rem[repeat]] == p[repeat]]
+        yield idx, p, e
+        reduced = rem > 1
+        idx, rem = idx[reduced], rem[reduced]
+
+
+def distinct_prime_factor_count(values: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Count the distinct prime factors of each positive integer in the input."""
+    values = np.asarray(values, dtype=np.int64)
+    count = np.zeros(values.size, dtype=np.int64)
+    for idx, _, _ in _prime_powers(values.ravel()):
+        count[idx] += 1
+    return count.reshape(values.shape)
+
+
+def distinct_prime_factor_chunks(
+    lo: int = 0, hi: int | None = None, segment: int = SEGMENT_SIZE
+) -> Iterator[npt.NDArray[np.int64]]:
+    """
+    Generate the distinct prime factor counts of the integers in ``[lo, hi)``
+    (or from ``lo`` onwards without end if ``hi`` is None), sieving one segment
+    of (at most) ``segment`` integers at a time. 0 and 1 count as having none.
+
+    Each prime up to the square root of a segment is counted and divided out
+    (with all its powers); whatever remains above 1 is one more, larger prime.
+    """
+    mask = _PRIME_MASK
+    for seg_lo in itertools.count(lo, segment):
+        seg_hi = seg_lo + segment if hi is None else min(seg_lo + segment, hi)
+        if seg_lo >= seg_hi:
+            return
+        # Grow the base primes geometrically as the segments move up
+        root = math.isqrt(seg_hi - 1)
+        if root >= len(mask):
+            mask = _sieve(mask, max(root + 1, 2 * len(mask)))
+        rest = np.arange(seg_lo, seg_hi, dtype=np.int64)
+        count = np.zeros(len(rest), dtype=np.int64)
+        for p in np.flatnonzero(mask[: root + 1]).tolist():
+            count[-seg_lo % p :: p] += 1
+            power = p
+            while power < seg_hi:
+                rest[-seg_lo % power :: power] //= p
+                power *= p
+        count += rest > 1
+        count[: max(2 - seg_lo, 0)] = 0
+        yield count
+
+
+def divisor_count(values: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Count the divisors of each positive integer in the input."""
+    values = np.asarray(values, dtype=np.int64)
+    count = np.ones(values.size, dtype=np.int64)
+    for idx, _, e in _prime_powers(values.ravel()):
+        count[idx] *= e + 1
+    return count.reshape(values.shape)
+
+
+def divisor_sum(values: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Sum the divisors (including itself) of each positive integer in the input."""
+    values = np.asarray(values, dtype=np.int64)
+    total = np.ones(values.size, dtype=np.int64)
+    for idx, p, e in _prime_powers(values.ravel()):
+        # 1 + p + ... + p^e, without the overflowing p^(e + 1)
+        term = np.ones_like(p)
+        power = np.ones_like(p)
+        for k in range(int(e.max())):
+            power = np.where(k < e, power * p, power)
+            term += np.where(k < e, power, 0)
+        total[idx] *= term
+    return total.reshape(values.shape)
+
+
 ###############################################################################
 # COPRIMES
 ##############################################################################
-def _coprime_children(m: int, n: int, stop: int) -> Iterator[tuple[int, int]]:
-    """
-    https://en.wikipedia.org/wiki/Coprime_integers#Generating_all_coprime_pairs
+CoprimeArray = npt.NDArray[np.int64]
+COPRIME_CHUNK_SIZE = 1 << 16
+
+
+def _coprime_tree(
+    root: tuple[int, int], stop: int, chunk_size: int | None = None
+) -> Iterator[CoprimeArray]:
     """
-    if m <= stop:
-        yield (m, n)
-        yield from _coprime_children(2 * m - n, m, stop)
-        yield from _coprime_children(2 * m + n, m, stop)
-        yield from _coprime_children(m + 2 * n, n, stop)
+    Expand the tree of coprime pairs ``(m, n)`` rooted at ``root``, yielding
+    ``(k, 2)`` arrays of the pairs where ``m <= stop``.
 
+    Without a chunk size every array is one complete level of the tree. With a
+    chunk size the frontier is split into chunks and expanded depth-first, so
+    memory stays proportional to ``chunk_size`` times the tree depth.
 
-def coprimes_odd_odd(stop: int) -> list[tuple[int, int]]:
+    https://en.wikipedia.org/wiki/Coprime_integers#Generating_all_coprime_pairs
+    """
+    stack = [np.array([root], dtype=np.int64)]
+    while stack:
+        pairs = stack.pop()
+        if chunk_size is not None and len(pairs) > chunk_size:
+            stack.extend(
+                pairs[i : i + chunk_size]
+                for i in reversed(range(0, len(pairs), chunk_size))
+            )
+            continue
+        # Children always have a larger m, so whole subtrees are pruned here
+        pairs = pairs[pairs[:, 0] <= stop]
+        if not len(pairs):
+            continue
+        yield pairs
+        m, n = pairs[:, 0], pairs[:, 1]
+        stack.append(
+            np.concatenate(
+                (
+                    np.column_stack((2 * m - n, m)),
+                    np.column_stack((2 * m + n, m)),
+                    np.column_stack((m + 2 * n, n)),
+                )
+            )
+        )
+
+
+def _coprime_array(*roots: tuple[int, int], stop: int) -> CoprimeArray:
+    levels = [level for root in roots for level in _coprime_tree(root, stop)]
+    return np.concatenate(levels) if levels else np.empty((0, 2), dtype=np.int64)
+
+
+def coprimes_odd_odd(stop: int) -> CoprimeArray:
     """Generate all odd coprime pairs `(m, n)` where `stop >= m > n`."""
-    return list(_coprime_children(3, 1, stop))
+    return _coprime_array((3, 1), stop=stop)
 
 
-def coprimes_odd_even(stop: int) -> list[tuple[int, int]]:
+def coprimes_odd_even(stop: int) -> CoprimeArray:
     """Generate all odd, even coprime pairs `(m, n)` where `stop >= m > n`."""
-    return list(_coprime_children(2, 1, stop))
+    return _coprime_array((2, 1), stop=stop)
 
 
-def coprimes(stop: int) -> list[tuple[int, int]]:
+def coprimes(stop: int) -> CoprimeArray:
     """Generate all coprime pairs `(m, n)` where `stop >= m > n`."""
-    return [
-        *_coprime_children(3, 1, stop),
-        *_coprime_children(2, 1, stop),
-    ]
+    return _coprime_array((3, 1), (2, 1), stop=stop)
+
+
+def coprime_chunks(
+    stop: int, chunk_size: int = COPRIME_CHUNK_SIZE
+) -> Iterator[CoprimeArray]:
+    """
+    Generate all coprime pairs `(m, n)` where `stop >= m > n` as a stream of
+    arrays holding at most ``chunk_size`` pairs each.
+    """
+    yield from _coprime_tree((3, 1), stop, chunk_size)
+    yield from _coprime_tree((2, 1), stop, chunk_size)
 
 
 ###############################################################################
 # TRIANGLES
 ###############################################################################
 Triangle = tuple[int, int, int]
-TriangleGenerator = Iterator[Triangle]
+TriangleArray = npt.NDArray[np.int64]
 
 
 def euclid(m: int, n: int) -> Triangle:
@@ -170,30 +820,76 @@ def euclid(m: int, n: int) -> Triangle:
     )
 
 
-def generate_primitive_triples(stop: int) -> TriangleGenerator:
+def generate_primitive_triples(
+    stop: int | None = None, perimeter: int | None = None
+) -> TriangleArray:
     """
-    Generates all primitive pythagorean triples (a, b, c) where c (the hypotenuse)
-    does not exceed ``stop``.
-
-    NOTE: stop handling is buggy; there may be extra triples.
+    Generate a ``(k, 3)`` array of all primitive pythagorean triples (a, b, c)
+    where c (the hypotenuse) does not exceed ``stop`` and a + b + c does not
+    exceed ``perimeter``. At least one bound is required.
     """
-    # c <= stop
-    # c = m^2 + n^2
-    # c > m^2
-    m_max = math.ceil(math.sqrt(stop))
-    for m, n in _coprime_children(2, 1, m_max):
-        yield euclid(m, n)
-
-
-def generate_triples(stop: int) -> TriangleGenerator:
+    if perimeter is not None:
+        # c < (a + b + c) / 2
+        stop = perimeter // 2 if stop is None else min(stop, perimeter // 2)
+    if stop is None:
+        raise ValueError("Either stop or perimeter is required")
+    # c = m^2 + n^2 and n >= 1, so m^2 < c
+    m_max = math.isqrt(max(stop - 1, 0))
+    triples = []
+    for pairs in _coprime_tree((2, 1), m_max, COPRIME_CHUNK_SIZE):
+        m, n = pairs[:, 0], pairs[:, 1]
+        chunk = np.column_stack((m * m - n * n, 2 * m * n, m * m + n * n))
+        keep = chunk[:, 2] <= stop
+        if perimeter is not None:
+            keep &= 2 * m * (m + n) <= perimeter
+        triples.append(chunk[keep])
+    return np.concatenate(triples) if triples else np.empty((0, 3), dtype=np.int64)
+
+
+def generate_triples(
+    stop: int | None = None, perimeter: int | None = None
+) -> TriangleArray:
     """
-    Generates all pythagorean triples (a, b, c) where c (the hypotenuse) does
-    not exceed ``stop``.
+    Generate a ``(k, 3)`` array of all pythagorean triples (a, b, c) where c
+    (the hypotenuse) does not exceed ``stop`` and a + b + c does not exceed
+    ``perimeter``. At least one bound is required.
     """
-    for primitive in generate_primitive_triples(stop):
-        yield primitive
-        for i in range(2, stop):
-            triple = tuple((i * side for side in primitive))
-            if triple[-1] > stop:
-                break
-            yield triple  # type: ignore
+    primitives = generate_primitive_triples(stop, perimeter)
+    multiples = np.full(len(primitives), np.iinfo(np.int64).max)
+    if stop is not None:
+        multiples = np.minimum(multiples, stop // primitives[:, 2])
+    if perimeter is not None:
+        multiples = np.minimum(multiples, perimeter // primitives.sum(axis=1))
+    # Expand each primitive into its multiples 1..k
+    index = np.repeat(np.arange(len(primitives)), multiples)
+    offsets = np.repeat(np.cumsum(multiples) - multiples, multiples)
+    k = np.arange(len(index)) - offsets + 1
+    return cast(TriangleArray, primitives[index] * k[:, np.newaxis])
+
+
+def triple_perimeter_counts(limit: int) -> npt.NDArray[np.int32]:
+    """
+    Count the pythagorean triples with each perimeter, returning an array of
+    length ``limit + 1`` indexed by perimeter.
+    """
+    # Primitive perimeters a + b + c = 2m(m + n), without building the triples
+    m_max = (math.isqrt(2 * limit + 1) - 1) // 2
+    perimeters = []
+    for pairs in _coprime_tree((2, 1), m_max, COPRIME_CHUNK_SIZE):
+        chunk = 2 * pairs[:, 0] * pairs.sum(axis=1)
+        perimeters.append(chunk[chunk <= limit])
+    primitive, weight = np.unique(
+        np.concatenate(perimeters) if perimeters else np.empty(0, dtype=np.int64),
+        return_counts=True,
+    )
+    counts = np.zeros(limit + 1, dtype=np.int32)
+    # Small multipliers k: scatter k * p for every primitive p at once
+    k_max = math.isqrt(len(primitive))
+    for k in range(1, k_max + 1):
+        end = np.searchsorted(primitive, limit // k, side="right")
+        counts[k * primitive[:end]] += weight[:end].astype(np.int32)
+    # Larger multipliers only apply to small primitives: stride over them
+    end = np.searchsorted(primitive, limit // (k_max + 1), side="right")
+    for p, w in zip(primitive[:end].tolist(), weight[:end].tolist()):
+        counts[p * (k_max + 1) :: p] += w
+    return counts
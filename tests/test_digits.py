@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from euler.digits import (
+    concat,
+    digit_count,
+    digit_multisets,
+    digit_signature,
+    digit_sum,
+    digit_weight_sums,
+    reverse_digits,
+    rotations,
+    truncations,
+    weighted_length_bound,
+)
+
+VALUES = [0, 7, 10, 197, 1230, 987654321]
+
+
+def test_digit_count() -> None:
+    assert digit_count(VALUES).tolist() == [len(str(n)) for n in VALUES]
+
+
+def test_digit_sum() -> None:
+    expected = [sum(map(int, str(n))) for n in VALUES]
+    assert digit_sum(VALUES).tolist() == expected
+
+
+def test_reverse_digits() -> None:
+    expected = [int(str(n)[::-1]) for n in VALUES]
+    assert reverse_digits(VALUES).tolist() == expected
+
+
+def test_reverse_digits_object() -> None:
+    values = np.array([10**30 + 7, 2**100], dtype=object)
+    expected = [int(str(n)[::-1]) for n in values]
+    assert reverse_digits(values).tolist() == expected
+
+
+def test_digit_signature() -> None:
+    values = [0, 7, 1487, 4817, 8147, 1478, 1488, 10, 100, 9999999]
+    signatures = digit_signature(values).tolist()
+    for n, signature in zip(values, signatures):
+        assert signature == sum(16 ** int(d) for d in str(n))
+    assert signatures[2] == signatures[3] == signatures[4] == signatures[5]
+    assert len(set(signatures)) == len(values) - 3
+
+
+@pytest.mark.parametrize("left, right", [(1, 0), (12, 345), (7, 10), (0, 9)])
+def test_concat(left: int, right: int) -> None:
+    assert concat(left, right) == int(f"{left}{right}")
+
+
+def test_concat_broadcast() -> None:
+    assert concat([3, 7, 109], 673).tolist() == [3673, 7673, 109673]
+
+
+def test_rotations() -> None:
+    result = rotations([197, 7, 1230])
+    assert result.shape == (4, 3)
+    assert result[:, 0].tolist() == [197, 971, 719, 197]
+    assert result[:, 1].tolist() == [7, 7, 7, 7]
+    # Leading zeros are dropped from the rotated value
+    assert result[:, 2].tolist() == [1230, 2301, 3012, 123]
+
+
+def test_rotations_object() -> None:
+    value = 10**30 + 7
+    result = rotations(np.array([value], dtype=object))
+    word = str(value)
+    expected = [int(word[r:] + word[:r]) for r in range(len(word))]
+    assert result[:, 0].tolist() == expected
+
+
+def test_truncations() -> None:
+    assert truncations([3797, 5], "left")[:, 0].tolist() == [3797, 797, 97, 7]
+    assert truncations([3797, 5], "right")[:, 0].tolist() == [3797, 379, 37, 3]
+    # Shorter values repeat their last digit
+    assert truncations([3797, 5], "left")[:, 1].tolist() == [5, 5, 5, 5]
+
+
+def test_digit_multisets() -> None:
+    multisets = list(digit_multisets(2, [3, 1, 1]))
+    assert multisets == [(1, 1), (1, 3), (3, 3)]
+    # Multisets of 7 decimal digits: C(10 + 7 - 1, 7)
+    assert sum(1 for _ in digit_multisets(7)) == 11440
+
+
+@pytest.mark.parametrize("power, length", [(3, 4), (4, 5), (5, 6)])
+def test_weighted_length_bound(power: int, length: int) -> None:
+    assert weighted_length_bound([d**power for d in range(10)]) == length
+
+
+@pytest.mark.parametrize("power", [3, 4, 5])
+def test_digit_weight_sums(power: int) -> None:
+    weights = [d**power for d in range(10)]
+    limit = 10 ** weighted_length_bound(weights)
+    expected = [
+        n for n in range(1, limit) if n == sum(weights[d] for d in map(int, str(n)))
+    ]
+    assert list(digit_weight_sums(weights)) == expected
@@ -0,0 +1,27 @@
+import itertools
+import math
+
+import pytest
+
+from euler.factoradic import factorial, nth_permutation, permutation_rank
+
+
+@pytest.mark.parametrize("n", [0, 1, 5, 20, 25])
+def test_factorial(n: int) -> None:
+    assert factorial(n) == math.factorial(n)
+
+
+@pytest.mark.parametrize("items", ["", "a", "0123", "dcba"])
+def test_permutations(items: str) -> None:
+    for k, perm in enumerate(itertools.permutations(sorted(items))):
+        assert nth_permutation(items, k) == list(perm)
+        assert permutation_rank(perm) == k
+
+
+def test_large_permutation() -> None:
+    items = list(range(25))
+    k = factorial(25) - 12345
+    assert permutation_rank(nth_permutation(items, k)) == k
+    assert nth_permutation(items, factorial(25) - 1) == items[::-1]
+    with pytest.raises(ValueError):
+        nth_permutation(items, factorial(25))
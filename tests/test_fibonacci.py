@@ -0,0 +1,29 @@
+import itertools
+
+import pytest
+
+from euler.fibonacci import even_fibonacci_sum, fibonacci, iter_fibonacci
+
+FIBONACCI = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610]
+
+
+@pytest.mark.parametrize("n, value", list(enumerate(FIBONACCI)))
+def test_fibonacci(n: int, value: int) -> None:
+    assert fibonacci(n) == value
+
+
+def test_fibonacci_large() -> None:
+    # F(1000) has 209 digits; F(n) divides F(kn)
+    assert len(str(fibonacci(1000))) == 209
+    assert fibonacci(10**5) % fibonacci(10**4) == 0
+
+
+@pytest.mark.parametrize("start", [0, 1, 7])
+def test_iter_fibonacci(start: int) -> None:
+    assert list(itertools.islice(iter_fibonacci(start), 5)) == FIBONACCI[start:][:5]
+
+
+@pytest.mark.parametrize("limit", [0, 1, 2, 33, 34, 10**6, 10**100])
+def test_even_fibonacci_sum(limit: int) -> None:
+    terms = itertools.takewhile(lambda f: f <= limit, iter_fibonacci())
+    assert even_fibonacci_sum(limit) == sum(f for f in terms if f % 2 == 0)
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from euler.figurate import (
+    common_polygonals,
+    is_hexagonal,
+    is_pentagonal,
+    is_polygonal,
+    is_triangular,
+    polygonal,
+    polygonal_mask,
+    polygonal_numbers,
+)
+
+SIDES = [3, 4, 5, 6, 7, 8]
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        (3, [1, 3, 6, 10, 15]),
+        (4, [1, 4, 9, 16, 25]),
+        (5, [1, 5, 12, 22, 35]),
+        (6, [1, 6, 15, 28, 45]),
+    ],
+)
+def test_polygonal_numbers(s: int, expected: list[int]) -> None:
+    generator = polygonal_numbers(s)
+    assert [next(generator) for _ in expected] == expected
+    assert [polygonal(s, n) for n in range(1, 6)] == expected
+
+
+def test_polygonal_sides() -> None:
+    with pytest.raises(ValueError):
+        polygonal(2, 1)
+    with pytest.raises(ValueError):
+        is_polygonal(1, 2)
+
+
+@pytest.mark.parametrize("s", SIDES)
+def test_is_polygonal(s: int) -> None:
+    members = {polygonal(s, n) for n in range(1, 200)}
+    limit = polygonal(s, 199)
+    assert [x for x in range(-5, limit + 1) if is_polygonal(x, s)] == sorted(members)
+
+
+def test_named_polygonals() -> None:
+    assert is_triangular(40755) and is_pentagonal(40755) and is_hexagonal(40755)
+    assert not is_pentagonal(48)
+
+
+def test_is_polygonal_large() -> None:
+    # Beyond 2^53 a float square root can no longer tell these apart
+    n = 10**12
+    p = polygonal(5, n)
+    assert is_pentagonal(p)
+    assert not is_pentagonal(p + 1)
+    assert is_pentagonal(polygonal(5, 10**40))
+
+
+@pytest.mark.parametrize("s", SIDES)
+def test_polygonal_mask(s: int) -> None:
+    values = np.arange(-3, 5000)
+    expected = [is_polygonal(int(x), s) for x in values]
+    assert polygonal_mask(values, s).tolist() == expected
+
+
+@pytest.mark.parametrize("s", SIDES)
+def test_polygonal_mask_large(s: int) -> None:
+    # Around the int64 limit the mask falls back to exact integer checks
+    n = np.arange(10**9, 10**9 + 3, dtype=np.int64)
+    values = np.array([polygonal(s, int(i)) for i in n] + [2**63 - 1])
+    values = np.concatenate([values, values[:3] + 1])
+    expected = [is_polygonal(int(x), s) for x in values]
+    assert polygonal_mask(values, s).tolist() == expected
+    objects = np.array(
+        [polygonal(s, 10**30), polygonal(s, 10**30) + 1], dtype=object
+    )
+    assert polygonal_mask(objects, s).tolist() == [True, False]
+
+
+def test_common_polygonals() -> None:
+    generator = common_polygonals((3, 5, 6))
+    assert [next(generator) for _ in range(3)] == [1, 40755, 1533776805]
+    squares = common_polygonals((3, 4))
+    assert [next(squares) for _ in range(4)] == [1, 36, 1225, 41616]
@@ -0,0 +1,53 @@
+import pytest
+
+from euler.palindromes import (
+    is_palindrome,
+    multibase_palindromes,
+    palindromes,
+    palindromes_of_length,
+    reverse,
+)
+
+
+def _naive(stop: int, base: int) -> list[int]:
+    return [n for n in range(stop) if _digits(n, base) == _digits(n, base)[::-1]]
+
+
+def _digits(n: int, base: int) -> list[int]:
+    digits = [n % base]
+    while n := n // base:
+        digits.append(n % base)
+    return digits
+
+
+@pytest.mark.parametrize("n, base, expected", [(0, 10, 0), (1230, 10, 321), (6, 2, 3)])
+def test_reverse(n: int, base: int, expected: int) -> None:
+    assert reverse(n, base) == expected
+
+
+def test_is_palindrome() -> None:
+    assert is_palindrome(9009)
+    assert is_palindrome(585, 2)
+    assert not is_palindrome(10)
+    assert not is_palindrome(6, 2)
+
+
+@pytest.mark.parametrize("length", [1, 2, 3, 4])
+def test_palindromes_of_length(length: int) -> None:
+    expected = [n for n in _naive(10**length, 10) if len(str(n)) == length]
+    assert list(palindromes_of_length(length)) == expected
+    assert list(palindromes_of_length(length, descending=True)) == expected[::-1]
+
+
+@pytest.mark.parametrize("base", [2, 3, 10, 16])
+@pytest.mark.parametrize("stop", [0, 1, 2, 100, 1001, 5000])
+def test_palindromes(stop: int, base: int) -> None:
+    expected = _naive(stop, base)
+    assert list(palindromes(stop, base)) == expected
+    assert list(palindromes(stop, base, descending=True)) == expected[::-1]
+
+
+@pytest.mark.parametrize("bases", [(10, 2), (2, 3), (10, 2, 8)])
+def test_multibase_palindromes(bases: tuple[int, ...]) -> None:
+    expected = [n for n in range(10_000) if all(is_palindrome(n, b) for b in bases)]
+    assert list(multibase_palindromes(10_000, bases)) == expected
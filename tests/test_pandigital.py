@@ -0,0 +1,48 @@
+import itertools
+
+import pytest
+
+from euler.pandigital import is_pandigital, pandigitals
+
+
+@pytest.mark.parametrize(
+    "n, digits, expected",
+    [
+        (918273645, range(1, 10), True),
+        (918273644, range(1, 10), False),
+        (2143, range(1, 5), True),
+        (21435, range(1, 5), False),
+        (1023, range(4), True),
+    ],
+)
+def test_is_pandigital(n: int, digits: range, expected: bool) -> None:
+    assert is_pandigital(n, digits) == expected
+
+
+@pytest.mark.parametrize("digits", [range(1, 6), range(4), range(6), (2, 7, 9)])
+@pytest.mark.parametrize("length", [None, 1, 2, 4])
+@pytest.mark.parametrize("descending", [False, True])
+def test_pandigitals(digits: range, length: int | None, descending: bool) -> None:
+    perms = itertools.permutations(sorted(digits, reverse=descending), length)
+    # Numbers with a leading zero are skipped
+    expected = [int("".join(map(str, p))) for p in perms if p[0] or len(p) == 1]
+    assert all(is_pandigital(n, set(digits)) for n in expected if length is None)
+    assert list(pandigitals(digits, length, descending)) == expected
+    everything = list(pandigitals(digits, length, descending, lambda *_: True))
+    assert everything == expected
+
+
+def test_pandigitals_prune() -> None:
+    calls = []
+
+    def no_leading_two(prefix: int, size: int) -> bool:
+        calls.append((prefix, size))
+        return prefix != 2
+
+    assert list(pandigitals(range(1, 4), prune=no_leading_two)) == [
+        123,
+        132,
+        312,
+        321,
+    ]
+    assert (2, 1) in calls and (21, 2) not in calls
@@ -1,9 +1,56 @@
 import pytest
 
-from euler.problem_31 import solve
+from euler.problem_31 import change_ways, solve
 
 from .utils import validate_solution
 
+COINS = [1, 2, 5, 10, 20, 50, 100, 200]
+
+
+def _naive_ways(target: int, values: list[int], modulus: int | None) -> list[int]:
+    ways = [1] + [0] * target
+    for v in values:
+        for t in range(v, target + 1):
+            ways[t] += ways[t - v]
+    return ways if modulus is None else [w % modulus for w in ways]
+
+
+@pytest.mark.parametrize(
+    "target, values",
+    [(200, COINS), (1000, [3, 7, 11]), (50, []), (0, [1, 2]), (17, [20, 5])],
+)
+@pytest.mark.parametrize(
+    "modulus, exact",
+    [
+        (None, False),
+        (None, True),
+        (1, False),
+        (10**9 + 7, False),
+        (10**9 + 7, True),
+        # Blocked int64 sums with only a few rows per block
+        (2**60 + 33, False),
+        # Too large for int64 sums, so exact arithmetic takes over
+        (2**61 + 1, False),
+        (2**127 - 1, False),
+    ],
+)
+def test_change_ways(
+    target: int, values: list[int], modulus: int | None, exact: bool
+) -> None:
+    ways = change_ways(target, values, modulus=modulus, exact=exact)
+    assert [int(w) for w in ways] == _naive_ways(target, values, modulus)
+
+
+def test_change_ways_exact_beyond_int64() -> None:
+    ways = change_ways(100_000, COINS, exact=True)
+    assert int(ways[-1]) == _naive_ways(100_000, COINS, None)[-1]
+    assert int(ways[-1]) > 2**63
+
+
+def test_change_ways_invalid() -> None:
+    with pytest.raises(ValueError):
+        change_ways(10, [1, 0])
+
 
 @pytest.mark.solved
 def test_solution() -> None:
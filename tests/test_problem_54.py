@@ -1,10 +1,69 @@
+import numpy as np
 import pytest
 
-from euler.problem_54 import solve
+from euler.problem_54 import Card, Hand, hand_rank, rank_hands, solve
 
 from .utils import validate_solution
 
 
+def _hand(cards: str) -> Hand:
+    return Hand(*(Card.from_str(card) for card in cards.split()))
+
+
+@pytest.mark.parametrize(
+    "better, worse",
+    [
+        # Examples from the problem statement
+        ("2C 3S 8S 8D TD", "5H 5C 6S 7S KD"),
+        ("5D 8C 9S JS AC", "2C 5C 7D 8S QH"),
+        ("3D 6D 7D TD QD", "2D 9C AS AH AC"),
+        ("2H 2D 4C 4D 4S", "3C 3D 3S 9S 9D"),
+        # Kickers decide between equal pairs
+        ("4D 6S 9H QH QC", "3D 6D 7H QD QS"),
+        ("QH QC 9D 6S 5C", "QD QS 9H 6D 4S"),
+        ("KH KC 8D 8S 3C", "KD KS 8H 8C 2S"),
+        # The wheel is the lowest straight
+        ("2C 3D 4S 5S 6D", "AH 2D 3C 4D 5S"),
+        ("AH 2D 3C 4D 5S", "AH AD AC KD QS"),
+        ("AS 2S 3S 4S 5S", "AH AD AC AS KS"),
+        ("TS JS QS KS AS", "9S TS JS QS KS"),
+    ],
+)
+def test_hand_order(better: str, worse: str) -> None:
+    assert _hand(better) > _hand(worse)
+    assert _hand(worse) < _hand(better)
+
+
+@pytest.mark.parametrize(
+    "cards, best",
+    [
+        ("TS JS QS KS AS", "royal_flush"),
+        ("9S TS JS QS KS", "straight_flush"),
+        ("AS 2S 3S 4S 5S", "straight_flush"),
+        ("AH 2D 3C 4D 5S", "straight"),
+        ("2H 2D 4C 4D 4S", "full_house"),
+        ("2H 2D 4C 4D 9S", "two_pair"),
+        ("2H 7H 4H 9H JH", "flush"),
+        ("2H 7D 4C 9H JS", "high"),
+    ],
+)
+def test_get_best(cards: str, best: str) -> None:
+    assert _hand(cards).get_best() == best
+
+
+def test_rank_hands() -> None:
+    rng = np.random.default_rng(54)
+    deals = np.array([rng.choice(52, 5, replace=False) for _ in range(2000)])
+    faces, suits = deals // 4, deals % 4
+    # Include some flushes, which random deals rarely produce
+    suits[:200] = suits[:200, :1]
+    faces[:200] = [rng.choice(13, 5, replace=False) for _ in range(200)]
+    expected = [hand_rank(f, s) for f, s in zip(faces.tolist(), suits.tolist())]
+    assert rank_hands(faces, suits).tolist() == expected
+    grid = rank_hands(faces.reshape(4, 500, 5), suits.reshape(4, 500, 5))
+    assert grid.ravel().tolist() == expected
+
+
 @pytest.mark.solved
 def test_solution() -> None:
     validate_solution(solve, answer=376)
@@ -1,10 +1,71 @@
+import numpy as np
 import pytest
 
-from euler.problem_55 import solve
+from euler import problem_55
+from euler.problem_55 import lychrel_depth, lychrel_depths, solve
+from euler.utils import BoundedCache
 
 from .utils import validate_solution
 
 
+def _naive_depth(n: int, depth: int) -> int:
+    for step in range(1, depth + 1):
+        n += int(f"{n}"[::-1])
+        if f"{n}" == f"{n}"[::-1]:
+            return step
+    return 0
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> BoundedCache[int, int]:
+    cache: BoundedCache[int, int] = BoundedCache(maxsize=1 << 16)
+    monkeypatch.setattr(problem_55, "LYCHREL_CACHE", cache)
+    return cache
+
+
+def test_lychrel_depth_cache(cache: BoundedCache[int, int]) -> None:
+    # 349 -> 1292 -> 4213 -> 7337
+    assert lychrel_depth(349) == 3
+    assert cache.get(349) == 3 and cache.get(1292) == 2 and cache.get(4213) == 1
+    # Joining a known chain reuses the exact count
+    hits = cache.hits
+    assert lychrel_depth(943) == 3
+    assert cache.hits > hits
+    # Lychrel candidates record how far they were explored as a lower bound
+    assert lychrel_depth(196, depth=10) == 0
+    assert cache.get(196) == -10
+    assert lychrel_depth(196, depth=5) == 0
+    assert lychrel_depth(196, depth=20) == 0
+    assert cache.get(196) == -20
+    # A deeper search than the recorded bound explores further
+    assert lychrel_depth(10677, depth=50) == 0
+    assert lychrel_depth(10677, depth=53) == 53
+
+
+@pytest.mark.parametrize("maxsize", [4, 100, 1 << 16])
+def test_lychrel_depth_matches_naive(
+    cache: BoundedCache[int, int], maxsize: int
+) -> None:
+    cache.configure(maxsize=maxsize)
+    for depth in (50, 3, 30):
+        result = [lychrel_depth(n, depth) for n in range(3000)]
+        assert result == [_naive_depth(n, depth) for n in range(3000)]
+    assert len(cache) <= maxsize
+    if maxsize == 4:
+        assert cache.info().evictions > 0
+
+
+@pytest.mark.parametrize("start, stop", [(0, 3000), (10**17, 10**17 + 200), (5, 5)])
+@pytest.mark.parametrize("depth", [0, 3, 50, 60])
+def test_lychrel_depths(
+    cache: BoundedCache[int, int], start: int, stop: int, depth: int
+) -> None:
+    expected = [_naive_depth(n, depth) for n in range(start, stop)]
+    depths = lychrel_depths(start, stop, depth)
+    assert depths.dtype == np.int64
+    assert depths.tolist() == expected
+
+
 @pytest.mark.solved
 def test_solution() -> None:
     validate_solution(solve, answer=249)
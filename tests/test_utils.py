@@ -0,0 +1,263 @@
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from euler import utils
+
+PRIMES_BELOW_100 = [
+    2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41,
+    43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97,
+]  # fmt: skip
+
+
+def reset_mask(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, "_PRIME_MASK", np.zeros(2, dtype=np.bool_))
+    monkeypatch.setattr(utils, "_PRIME_MASK_CHANGED", False)
+    monkeypatch.setattr(utils, "_PRIME_BITS", None)
+    monkeypatch.setattr(utils, "_PRIME_BITS_N", 0)
+
+
+@pytest.fixture
+def empty_mask(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(utils, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(utils, "CACHE_IGNORE", tmp_path / ".gitignore")
+    monkeypatch.setattr(utils, "CACHE_PRIMES", tmp_path / ".primes.bin")
+    monkeypatch.setattr(utils, "CACHE_PRIMES_LEGACY", tmp_path / ".primes.npy")
+    monkeypatch.setattr(utils, "CACHE_LOCK", tmp_path / ".primes.lock")
+    reset_mask(monkeypatch)
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.filterwarnings("ignore:Cache miss")
+@pytest.mark.parametrize("steps", [(100,), (10, 100), (3, 4, 50, 51, 100)])
+def test_prime_mask(steps: tuple[int, ...]) -> None:
+    for n in steps:
+        mask = utils.prime_mask(n)
+    assert len(mask) == 100
+    assert np.flatnonzero(mask).tolist() == PRIMES_BELOW_100
+
+
+@pytest.mark.parametrize("n", [-5, 0, 1, 2, 3, 100])
+def test_prime_list(n: int) -> None:
+    utils.prime_mask(1000)
+    assert utils.prime_list(n) == [p for p in PRIMES_BELOW_100 if p < n]
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.filterwarnings("ignore:Cache miss", "ignore:Writing prime cache")
+def test_prime_cache_roundtrip(monkeypatch: pytest.MonkeyPatch) -> None:
+    utils.prime_mask(100)
+    utils._cache_write()
+    # One bit per odd number below 100, plus the header
+    assert utils.CACHE_PRIMES.stat().st_size == utils._CACHE_HEADER + 7
+    reset_mask(monkeypatch)
+    assert [n for n in range(100) if utils.is_prime(n)] == PRIMES_BELOW_100
+    assert len(utils._PRIME_MASK) == 2  # lookups did not unpack the cache
+    assert np.flatnonzero(utils.prime_mask(50)).tolist() == PRIMES_BELOW_100[:15]
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.filterwarnings("ignore:Cache miss", "ignore:Writing prime cache")
+def test_prime_cache_append(monkeypatch: pytest.MonkeyPatch) -> None:
+    utils.prime_mask(30)
+    utils._cache_write()
+    reset_mask(monkeypatch)
+    utils.prime_mask(100)
+    utils._cache_write()
+    assert utils._cache_length() == 100
+    reset_mask(monkeypatch)
+    assert np.flatnonzero(utils.prime_mask(100)).tolist() == PRIMES_BELOW_100
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.filterwarnings("ignore:Cache miss", "ignore:Writing prime cache")
+def test_prime_cache_keeps_largest(monkeypatch: pytest.MonkeyPatch) -> None:
+    utils.prime_mask(30)
+    # Another process writes a larger cache first
+    utils._cache_replace(utils._sieve(np.zeros(2, dtype=np.bool_), 100))
+    utils._cache_write()
+    assert utils._cache_length() == 100
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.filterwarnings("ignore:Migrating prime cache")
+def test_prime_cache_migration(monkeypatch: pytest.MonkeyPatch) -> None:
+    legacy = np.zeros(100, dtype=np.bool_)
+    legacy[PRIMES_BELOW_100] = True
+    np.save(utils.CACHE_PRIMES_LEGACY, legacy)
+    assert np.array_equal(utils.prime_mask(100), legacy)
+    assert utils.CACHE_PRIMES.exists()
+    assert not utils.CACHE_PRIMES_LEGACY.exists()
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.parametrize("segment", [2, 16, utils.SEGMENT_SIZE])
+@pytest.mark.parametrize("lo, hi", [(0, 100), (2, 3), (10, 90), (97, 98), (50, 50)])
+def test_iter_primes(lo: int, hi: int, segment: int) -> None:
+    expected = [p for p in PRIMES_BELOW_100 if lo <= p < hi]
+    assert list(utils.iter_primes(lo, hi, segment)) == expected
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    [
+        (4_294_967_291, True),  # largest prime below 2^32
+        (1_000_000_007, True),
+        (2**61 - 1, True),
+        (2**127 - 1, True),
+        (561, False),  # Carmichael number
+        (3_215_031_751, False),  # strong pseudoprime to bases 2, 3, 5, 7
+        (3_825_123_056_546_413_051, False),  # ... to bases 2 through 23
+        (2**64 + 1, False),
+    ],
+)
+def test_is_prime_unsieved(n: int, expected: bool) -> None:
+    assert utils._is_prime_unsieved(n) == expected
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.filterwarnings("ignore:Cache miss")
+def test_is_prime_many() -> None:
+    values = np.arange(-10, 20_000).reshape(-1, 10)
+    utils.prime_mask(100)
+    expected = np.vectorize(utils._is_prime_unsieved)(values) & (values > 1)
+    assert np.array_equal(utils.is_prime_many(values), expected)
+    large = np.array([2**32 - 5, 2**32 + 15, 2**61 - 1, 2**62])
+    assert utils.is_prime_many(large).tolist() == [True, True, True, False]
+
+
+def test_is_prime_many_edge_cases() -> None:
+    assert utils.is_prime_many([]).tolist() == []
+    assert utils.is_prime_many(np.empty((0, 3), dtype=np.int64)).shape == (0, 3)
+    # Values beyond int64 take the Python fallback
+    huge = np.array([2**70 + 1, 2**89 - 1, 7, 1], dtype=object)
+    assert utils.is_prime_many(huge).tolist() == [False, True, True, False]
+
+
+@pytest.mark.parametrize("policy, kept", [("lru", [1, 3]), ("fifo", [2, 3])])
+def test_bounded_cache(policy: utils.EvictionPolicy, kept: list[int]) -> None:
+    cache: utils.BoundedCache[int, str] = utils.BoundedCache(2, policy)
+    cache.put(1, "a")
+    cache.put(2, "b")
+    assert cache.get(1) == "a"
+    cache.put(3, "c")
+    assert [key for key in (1, 2, 3) if cache.get(key) is not None] == kept
+    assert cache.info() == utils.CacheInfo(3, 1, 1, 2, 2)
+    cache.configure(maxsize=1)
+    assert cache.info().evictions == 2 and len(cache) == 1
+
+
+@pytest.mark.usefixtures("empty_mask")
+@pytest.mark.filterwarnings("ignore:Cache miss")
+def test_is_prime_memo(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, "IS_PRIME_CACHE", utils.BoundedCache(4))
+    utils.prime_mask(100)
+    assert [n for n in range(100) if utils.is_prime(n)] == PRIMES_BELOW_100
+    assert len(utils.IS_PRIME_CACHE) == 0  # answered by the mask
+    assert [utils.is_prime(n) for n in (101, 103, 105, 101)] == [
+        True,
+        True,
+        False,
+        True,
+    ]
+    assert utils.IS_PRIME_CACHE.info() == utils.CacheInfo(1, 3, 0, 4, 3)
+
+
+def test_smallest_prime_factors() -> None:
+    spf = utils.smallest_prime_factors(100)
+    assert spf[:12].tolist() == [0, 1, 2, 3, 2, 5, 2, 7, 2, 3, 2, 11]
+    assert [n for n in range(2, 100) if spf[n] == n] == PRIMES_BELOW_100
+
+
+@pytest.mark.parametrize(
+    "n, factors",
+    [(1, {}), (2, {2: 1}), (360, {2: 3, 3: 2, 5: 1}), (9973, {9973: 1})],
+)
+def test_factorize(n: int, factors: dict[int, int]) -> None:
+    assert utils.factorize(n) == factors
+
+
+def test_factorize_beyond_table() -> None:
+    n = 2**31 + 11
+    assert utils.factorize(n) == {n: 1}
+    assert utils.factorize(2**40) == {2: 40}
+    assert utils.factorize(600851475143) == {71: 1, 839: 1, 1471: 1, 6857: 1}
+    assert utils.factorize(1_000_003 * 999_983) == {999_983: 1, 1_000_003: 1}
+    with pytest.raises(ValueError):
+        utils.smallest_prime_factors(utils.SPF_MAX + 1)
+
+
+def test_divisor_functions_beyond_table() -> None:
+    values = np.array([2**31 + 11, 2**40, 12, 600851475143])
+    assert utils.distinct_prime_factor_count(values).tolist() == [1, 1, 2, 4]
+    assert utils.divisor_count(values).tolist() == [2, 41, 6, 16]
+    expected = [2**31 + 12, 2**41 - 1, 28, 72 * 840 * 1472 * 6858]
+    assert utils.divisor_sum(values).tolist() == expected
+
+
+def test_divisor_functions() -> None:
+    values = np.arange(1, 500)
+    divisors = [[d for d in range(1, n + 1) if n % d == 0] for n in values]
+    distinct = [sum(1 for d in divs if utils.is_prime(d)) for divs in divisors]
+    assert utils.distinct_prime_factor_count(values).tolist() == distinct
+    assert utils.divisor_count(values).tolist() == list(map(len, divisors))
+    assert utils.divisor_sum(values).tolist() == list(map(sum, divisors))
+    assert utils.divisor_sum(28) == 56
+
+
+@pytest.mark.parametrize(
+    "lo, hi, segment", [(0, 1000, 64), (0, 1000, 1000), (517, 4096, 100)]
+)
+def test_distinct_prime_factor_chunks(lo: int, hi: int, segment: int) -> None:
+    chunks = list(utils.distinct_prime_factor_chunks(lo, hi, segment))
+    assert all(len(chunk) <= segment for chunk in chunks)
+    expected = [len(utils.factorize(n)) if n else 0 for n in range(lo, hi)]
+    assert np.concatenate(chunks).tolist() == expected
+
+
+def test_distinct_prime_factor_chunks_unbounded() -> None:
+    chunks = utils.distinct_prime_factor_chunks(10**6, segment=1000)
+    counts = np.concatenate([next(chunks) for _ in range(5)])
+    values = np.arange(10**6, 10**6 + 5000)
+    assert counts.tolist() == utils.distinct_prime_factor_count(values).tolist()
+
+
+@pytest.mark.parametrize("stop", [1, 2, 3, 50])
+def test_coprimes(stop: int) -> None:
+    expected = sorted(
+        (m, n) for m in range(2, stop + 1) for n in range(1, m) if math.gcd(m, n) == 1
+    )
+    assert sorted(map(tuple, utils.coprimes(stop).tolist())) == expected
+    odd_even = [(m, n) for m, n in expected if (m + n) % 2]
+    assert sorted(map(tuple, utils.coprimes_odd_even(stop).tolist())) == odd_even
+    chunks = list(utils.coprime_chunks(stop, chunk_size=4))
+    assert all(len(chunk) <= 4 for chunk in chunks)
+    assert sorted(tuple(pair) for c in chunks for pair in c.tolist()) == expected
+
+
+@pytest.mark.parametrize("stop, perimeter", [(30, None), (None, 60), (30, 60)])
+def test_generate_triples(stop: int | None, perimeter: int | None) -> None:
+    c_max = stop or 30
+    expected = {
+        (a, b, c)
+        for c in range(1, c_max + 1)
+        for b in range(1, c)
+        for a in range(1, b)
+        if a * a + b * b == c * c and (perimeter is None or a + b + c <= perimeter)
+    }
+    triples = utils.generate_triples(stop, perimeter)
+    assert triples.shape == (len(expected), 3)
+    assert {(min(a, b), max(a, b), c) for a, b, c in triples.tolist()} == expected
+    primitives = utils.generate_primitive_triples(stop, perimeter).tolist()
+    assert sorted(tuple(sorted(t)) for t in primitives) == sorted(
+        t for t in expected if math.gcd(*t) == 1
+    )
+
+
+@pytest.mark.parametrize("limit", [0, 12, 1000])
+def test_triple_perimeter_counts(limit: int) -> None:
+    perimeters = utils.generate_triples(perimeter=limit).sum(axis=1)
+    expected = np.bincount(perimeters, minlength=limit + 1)
+    assert np.array_equal(utils.triple_perimeter_counts(limit), expected)